@@ -1,5 +1,8 @@
 """Environment and bulk operations API endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+import hashlib
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import List
 from ..database.database import get_db
@@ -16,6 +19,15 @@ from datetime import datetime
 
 router = APIRouter(prefix="/api/environments", tags=["environments"])
 
+def _conditional_json(request: Request, content) -> Response:
+    """JSON response tagged with a hash of its body; 304 when the client already has this version"""
+    response = JSONResponse(jsonable_encoder(content))
+    etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
 # ===== ENVIRONMENTS =====
 
 @router.post("/", response_model=DynatraceEnvironmentResponse)
@@ -64,11 +76,12 @@ async def create_environment(
 
 @router.get("/", response_model=List[DynatraceEnvironmentResponse])
 async def list_environments(
+    request: Request,
     env_type: str = None,
     active_only: bool = False,
     db: Session = Depends(get_db)
 ):
-    """List all environments"""
+    """List all environments; polled by the desktop UI, so answers 304 when unchanged"""
     query = db.query(DynatraceEnvironment)
     
     if env_type:
@@ -77,7 +90,7 @@ async def list_environments(
     if active_only:
         query = query.filter(DynatraceEnvironment.is_active == True)
     
-    return query.all()
+    return _conditional_json(request, [DynatraceEnvironmentResponse.model_validate(env) for env in query.all()])
 
 @router.get("/{env_id}", response_model=DynatraceEnvironmentResponse)
 async def get_environment(
@@ -187,10 +200,11 @@ async def create_group(
 
 @router.get("/groups/", response_model=List[EnvironmentGroupResponse])
 async def list_groups(
+    request: Request,
     db: Session = Depends(get_db)
 ):
-    """List all environment groups"""
-    return db.query(EnvironmentGroup).all()
+    """List all environment groups; answers 304 when unchanged"""
+    return _conditional_json(request, [EnvironmentGroupResponse.model_validate(g) for g in db.query(EnvironmentGroup).all()])
 
 @router.get("/groups/{group_id}", response_model=EnvironmentGroupResponse)
 async def get_group(
@@ -399,9 +413,10 @@ async def get_bulk_operation(
 
 @router.get("/bulk/")
 async def list_bulk_operations(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
-    """List bulk operations"""
-    return db.query(BulkOperation).offset(skip).limit(limit).all()
+    """List bulk operations; answers 304 when unchanged"""
+    return _conditional_json(request, db.query(BulkOperation).offset(skip).limit(limit).all())
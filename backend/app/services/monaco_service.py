@@ -31,10 +31,11 @@ class MonacoCliService:
             if not cli_path.endswith('.exe'):
                 cli_path = f"{cli_path}.exe"
             
+            # Only the exit code matters, so don't pipe (and drain) the output
             result = subprocess.run(
                 [cli_path, "version"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=10
             )
             return result.returncode == 0
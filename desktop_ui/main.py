@@ -1,6 +1,7 @@
 """Main PyQt6 desktop application"""
 import sys
 import json
+from importlib import import_module
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -9,13 +10,16 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon
 
-from .windows.dashboard import DashboardWindow
-from .windows.backup_wizard import BackupWizardWindow
-from .windows.restore_wizard import RestoreWizardWindow
-from .windows.connections import ConnectionsWindow
-from .windows.environments import EnvironmentsWindow
-from .windows.schedules import SchedulesWindow
-from .windows.settings import SettingsWindow
+# (tab label, windows module, class, MainWindow attribute); each window module is
+# imported and its window built only when the tab is first opened
+_TABS = (
+    ("Dashboard", "dashboard", "DashboardWindow", "dashboard_window"),
+    ("🌍 Environments", "environments", "EnvironmentsWindow", "environments_window"),  # NEW: Multi-environment management
+    ("New Backup", "backup_wizard", "BackupWizardWindow", "backup_wizard"),
+    ("Restore", "restore_wizard", "RestoreWizardWindow", "restore_wizard"),
+    ("Connections (Legacy)", "connections", "ConnectionsWindow", "connections_window"),
+    ("Schedules", "schedules", "SchedulesWindow", "schedules_window"),
+)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -40,19 +44,12 @@ class MainWindow(QMainWindow):
         
         # Create tab widget
         self.tabs = QTabWidget()
-        self.dashboard_window = DashboardWindow()
-        self.environments_window = EnvironmentsWindow()  # NEW: Multi-environment management
-        self.backup_wizard = BackupWizardWindow()
-        self.restore_wizard = RestoreWizardWindow()
-        self.connections_window = ConnectionsWindow()
-        self.schedules_window = SchedulesWindow()
-        
-        self.tabs.addTab(self.dashboard_window, "Dashboard")
-        self.tabs.addTab(self.environments_window, "🌍 Environments")  # NEW
-        self.tabs.addTab(self.backup_wizard, "New Backup")
-        self.tabs.addTab(self.restore_wizard, "Restore")
-        self.tabs.addTab(self.connections_window, "Connections (Legacy)")
-        self.tabs.addTab(self.schedules_window, "Schedules")
+        for label, *_ in _TABS:
+            holder = QWidget()
+            QVBoxLayout(holder).setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(holder, label)
+        self.tabs.currentChanged.connect(self.load_tab)
+        self.load_tab(self.tabs.currentIndex())
         
         layout.addWidget(self.tabs)
         
@@ -63,6 +60,17 @@ class MainWindow(QMainWindow):
         
         self.show()
     
+    def load_tab(self, index: int) -> QWidget:
+        """Import and build the window of the given tab on first use; return it"""
+        _, module, class_name, attribute = _TABS[index]
+        window = getattr(self, attribute, None)
+        if window is None:
+            window_class = getattr(import_module(f".windows.{module}", __package__), class_name)
+            window = window_class()
+            setattr(self, attribute, window)
+            self.tabs.widget(index).layout().addWidget(window)
+        return window
+    
     def _create_toolbar(self) -> QHBoxLayout:
         """Create toolbar"""
         layout = QHBoxLayout()
@@ -86,6 +94,7 @@ class MainWindow(QMainWindow):
     
     def _open_settings(self):
         """Open settings dialog"""
+        from .windows.settings import SettingsWindow
         settings_window = SettingsWindow(self)
         settings_window.exec()
 
@@ -0,0 +1,29 @@
+"""Helpers shared by the desktop windows"""
+from functools import lru_cache
+from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtWidgets import QApplication, QStyle
+
+# Button icon names mapped onto the style's built-in pixmaps; the style has
+# nothing that reads as add or edit, so those buttons keep their text glyphs
+_ICON_PIXMAPS = {
+    "save": QStyle.StandardPixmap.SP_DialogSaveButton,
+    "cancel": QStyle.StandardPixmap.SP_DialogCancelButton,
+    "ok": QStyle.StandardPixmap.SP_DialogOkButton,
+    "trash": QStyle.StandardPixmap.SP_TrashIcon,
+    "connect": QStyle.StandardPixmap.SP_DriveNetIcon,
+    "backup": QStyle.StandardPixmap.SP_DriveHDIcon,
+    "restore": QStyle.StandardPixmap.SP_BrowserReload,
+    "compare": QStyle.StandardPixmap.SP_FileDialogContentsView,
+}
+
+
+@lru_cache(maxsize=16)
+def font(size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Return a shared Segoe UI font; Qt copies it implicitly on setFont"""
+    return QFont("Segoe UI", size, weight)
+
+
+@lru_cache(maxsize=None)
+def icon(name: str) -> QIcon:
+    """Return a shared button icon, rendered once from the application style"""
+    return QApplication.style().standardIcon(_ICON_PIXMAPS[name])
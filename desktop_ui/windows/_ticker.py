@@ -0,0 +1,25 @@
+"""Shared periodic tick bus for window auto-refresh"""
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+
+class Ticker(QObject):
+    """Single coarse timer that all periodic consumers subscribe to"""
+    tick_30s = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._timer.timeout.connect(self.tick_30s)
+        self._timer.start(30000)
+
+
+_TICKER = None
+
+
+def get_ticker() -> Ticker:
+    """Return the shared Ticker, creating it once the QApplication exists"""
+    global _TICKER
+    if _TICKER is None:
+        _TICKER = Ticker()
+    return _TICKER
@@ -0,0 +1,76 @@
+"""Background workers shared by the desktop windows"""
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+
+def make_session() -> requests.Session:
+    """HTTP session with a pooled, retrying adapter shared by the window, its workers and dialogs"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+@lru_cache(maxsize=None)
+def default_session() -> requests.Session:
+    """Shared session for dialogs and workers not handed one by their window"""
+    return make_session()
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker back onto the GUI thread"""
+    finished = pyqtSignal(object)
+    error = pyqtSignal(Exception)
+    progress = pyqtSignal(int)
+
+
+class Worker(QRunnable):
+    """Run a blocking callable on a QThreadPool and report the result via signals"""
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as exc:
+            self.signals.error.emit(exc)
+        else:
+            self.signals.finished.emit(result)
+
+
+class HttpWorker(Worker):
+    """Run one API call on a QThreadPool
+
+    ``finished`` carries ``(status_code, payload, headers)`` where the payload
+    is the decoded JSON body of a 200 response and the raw text otherwise;
+    transport errors are reported through ``error``.
+    """
+    def __init__(self, session, method: str, url: str, json=None, timeout: float = 10, headers=None):
+        super().__init__(self._request, session, method, url, json, timeout, headers)
+
+    @staticmethod
+    def _request(session, method, url, json, timeout, headers) -> tuple:
+        resp = session.request(method, url, json=json, timeout=timeout, headers=headers)
+        if resp.status_code == 200:
+            return resp.status_code, json_loads(resp.content) if resp.content else None, resp.headers
+        return resp.status_code, resp.text, resp.headers
@@ -7,6 +7,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
 
+from ._common import font
+
 class BackupWizardWindow(QWidget):
     def __init__(self):
         super().__init__()
@@ -18,7 +20,7 @@ class BackupWizardWindow(QWidget):
         
         # Title
         title = QLabel("Create New Backup")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(font(14, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Connection selection
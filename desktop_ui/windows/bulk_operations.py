@@ -1,17 +1,133 @@
 """Bulk Operations Dialogs"""
+import os
+import threading
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+    QMainWindow, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
     QTableWidgetItem, QCheckBox, QGroupBox, QComboBox, QTextEdit,
     QProgressBar, QMessageBox, QListWidget, QListWidgetItem, QSpinBox,
     QHeaderView, QLineEdit
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 from datetime import datetime
 
+from ._common import font
+from ._workers import HttpWorker, WorkerSignals, default_session
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api")
+
+# Checkbox label -> ConfigTypeEnum value accepted by the bulk API
+_CONFIG_TYPE_KEYS = {
+    "Alerting Rules": "alerting",
+    "Dashboards": "dashboards",
+    "SLO": "slo",
+    "Service-Level Objectives": "slo",
+    "Maintenance Windows": "maintenance",
+    "Notifications": "notification",
+    "Management Zones": "management_zone",
+    "Anomaly Detection": "anomaly_detection",
+    "Auto Tags": "auto_tags",
+    "Application Detection Rules": "application_detection",
+    "Service Detection": "service_detection",
+    "Request Attributes": "request_attributes",
+    "Metric Events": "metric_events",
+    "Synthetic Monitors": "synthetic_monitors",
+    "Extensions": "extensions",
+    "All": "all",
+}
+
+# Config types the bulk compare endpoint can fetch
+_COMPARE_TYPES = frozenset({"alerting", "dashboards", "slo", "all"})
+
+_ACTIVE_STATUSES = ("pending", "in_progress")
+# Status polls before a bulk operation is given up on (30 minutes at the default interval)
+_MAX_POLLS = 900
+
+
+def _show_status(dialog: QDialog, message: str, timeout: int = 3000):
+    """Show a transient, non-blocking message on the main window status bar"""
+    parent = dialog.parentWidget()
+    main_window = parent.window() if parent else None
+    if isinstance(main_window, QMainWindow):
+        main_window.statusBar().showMessage(message, timeout)
+
+
+def _target_choices(environments: dict, groups: dict, singles: bool = False) -> list[tuple[str, list]]:
+    """(label, environment ids) for the environment/group pickers"""
+    choices = [("All Environments", list(environments))]
+    for group in groups.values():
+        ids = [env_id for env_id in group.get("environment_ids") or [] if env_id in environments]
+        choices.append((f"Group: {group.get('name', '')}", ids))
+    for env_type in ("production", "staging"):
+        ids = [env_id for env_id, env in environments.items() if env.get("env_type") == env_type]
+        choices.append((f"{env_type.capitalize()} Tier Only", ids))
+    if singles:
+        choices.extend((f"Single: {env.get('name', '')}", [env_id]) for env_id, env in environments.items())
+    return choices
+
+
+def _add_choices(combo: QComboBox, choices: list[tuple[str, list]]):
+    """Fill a picker, keeping each entry's environment ids as its item data"""
+    for label, ids in choices:
+        combo.addItem(label, ids)
+
+
+class BulkOperationWorker(QRunnable):
+    """Submit a bulk operation and poll its status off the GUI thread"""
+    def __init__(self, api_base: str, operation_type: str, payload: dict, poll_interval: float = 2.0,
+                 session=None, max_polls: int = _MAX_POLLS):
+        super().__init__()
+        self.session = session if session is not None else default_session()
+        self.api_base = api_base
+        self.operation_type = operation_type
+        self.payload = payload
+        self.poll_interval = poll_interval
+        self.max_polls = max_polls
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop polling at the next interval; the operation itself keeps running on the backend"""
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            resp = self.session.post(
+                f"{self.api_base}/environments/bulk/{self.operation_type}",
+                json=self.payload,
+                timeout=15,
+            )
+            resp.raise_for_status()
+            op_id = resp.json()["bulk_operation_id"]
+            self.signals.progress.emit(0)
+            
+            op = {}
+            for _ in range(self.max_polls):
+                if self._cancelled.wait(self.poll_interval):
+                    return
+                resp = self.session.get(f"{self.api_base}/environments/bulk/{op_id}", timeout=10)
+                resp.raise_for_status()
+                op = resp.json()
+                total = op.get("total_environments") or 0
+                done = (op.get("successful_count") or 0) + (op.get("failed_count") or 0) + (op.get("partial_count") or 0)
+                # A restore counts one result per backup and target, so done can exceed total
+                self.signals.progress.emit(min(100, done * 100 // total) if total else 0)
+                if op.get("status") not in _ACTIVE_STATUSES:
+                    break
+            else:
+                raise TimeoutError(f"Bulk operation {op_id} still {op.get('status')} after {self.max_polls} status checks")
+        except Exception as exc:
+            self.signals.error.emit(exc)
+        else:
+            self.signals.progress.emit(100)
+            self.signals.finished.emit(op)
+
 class BulkBackupDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, environments: dict = None, groups: dict = None):
         super().__init__(parent)
+        self.environments = environments or {}
+        self.groups = groups or {}
+        self.payload = None
         self.setWindowTitle("Bulk Backup - Multi-Environment")
         self.setGeometry(100, 100, 600, 700)
         self.init_ui()
@@ -22,27 +138,21 @@ class BulkBackupDialog(QDialog):
         
         # Title
         title = QLabel("Bulk Backup Configuration")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Select environment group
         layout.addWidget(QLabel("Select Environments or Group:"))
-        group_combo = QComboBox()
-        group_combo.addItems([
-            "All Environments",
-            "Group: All Production",
-            "Group: Team A",
-            "Group: Team B",
-            "Production Tier Only",
-            "Staging Tier Only"
-        ])
-        layout.addWidget(group_combo)
+        self.group_combo = QComboBox()
+        _add_choices(self.group_combo, _target_choices(self.environments, self.groups))
+        layout.addWidget(self.group_combo)
         
         # Config types
         layout.addWidget(QLabel("Configuration Types:"))
         config_group = QGroupBox("Select types to backup")
         config_layout = QVBoxLayout()
         
+        self.config_checks = []
         for config_type in ["Alerting Rules", "Dashboards", "SLO", "Service-Level Objectives",
                            "Maintenance Windows", "Notifications", "Management Zones",
                            "Anomaly Detection", "Auto Tags", "Application Detection Rules",
@@ -51,15 +161,19 @@ class BulkBackupDialog(QDialog):
             check = QCheckBox(config_type)
             check.setChecked(config_type == "All")
             config_layout.addWidget(check)
+            self.config_checks.append(check)
         
         config_group.setLayout(config_layout)
         layout.addWidget(config_group)
         
         # Management Zone filter
         layout.addWidget(QLabel("Filter by Management Zone (optional):"))
-        zone_combo = QComboBox()
-        zone_combo.addItems(["All Zones", "Zone 1", "Zone 2", "Zone 3"])
-        layout.addWidget(zone_combo)
+        self.zone_combo = QComboBox()
+        self.zone_combo.addItem("All Zones")
+        # Zones are defined per environment, so there is no list to offer across several
+        self.zone_combo.setEnabled(False)
+        self.zone_combo.setToolTip("Bulk backups always include every management zone")
+        layout.addWidget(self.zone_combo)
         
         # Backup location
         layout.addWidget(QLabel("Backup Location:"))
@@ -105,7 +219,7 @@ class BulkBackupDialog(QDialog):
         button_layout.addStretch()
         
         start_btn = QPushButton("▶ Start Bulk Backup")
-        start_btn.clicked.connect(lambda: self._start_backup())
+        start_btn.clicked.connect(self._start_backup)
         button_layout.addWidget(start_btn)
         
         cancel_btn = QPushButton("✕ Cancel")
@@ -119,13 +233,32 @@ class BulkBackupDialog(QDialog):
     
     def _start_backup(self):
         """Start bulk backup"""
-        QMessageBox.information(self, "Bulk Backup Started", 
-                              "Bulk backup is running across all selected environments.\nProgress will be shown in the Bulk Operations tab.")
+        environment_ids = self.group_combo.currentData() or []
+        if not environment_ids:
+            QMessageBox.warning(self, "Bulk Backup", "The selected environments or group contain no environments")
+            return
+        config_types = sorted({_CONFIG_TYPE_KEYS[c.text()] for c in self.config_checks if c.isChecked()})
+        if not config_types:
+            QMessageBox.warning(self, "Bulk Backup", "Select at least one configuration type")
+            return
+        self.payload = {
+            "name": f"Bulk backup {datetime.now():%Y-%m-%d %H:%M}",
+            "environment_ids": environment_ids,
+            "config_types": ["all"] if "all" in config_types else config_types,
+        }
+        # Progress is reported in the Bulk Operations tab, so don't block here
+        _show_status(self, "Bulk backup started")
         self.accept()
 
 class BulkRestoreDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, environments: dict = None, groups: dict = None,
+                 api_base: str = API_BASE_URL):
         super().__init__(parent)
+        self.environments = environments or {}
+        self.groups = groups or {}
+        self.api_base = api_base
+        self.payload = None
+        self._loaded = False
         self.setWindowTitle("Bulk Restore - Multi-Environment")
         self.setGeometry(100, 100, 600, 750)
         self.init_ui()
@@ -136,38 +269,29 @@ class BulkRestoreDialog(QDialog):
         
         # Title
         title = QLabel("Bulk Restore Configuration")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Target environment group
         layout.addWidget(QLabel("Target Environments or Group:"))
-        group_combo = QComboBox()
-        group_combo.addItems([
-            "Select target",
-            "Group: All Staging",
-            "Group: Team A Staging",
-            "Single: Staging-1"
-        ])
-        layout.addWidget(group_combo)
-        
-        # Select backup for each environment
-        layout.addWidget(QLabel("Select Backup for Each Environment:"))
-        
-        table = QTableWidget()
-        table.setColumnCount(4)
-        table.setHorizontalHeaderLabels(["Environment", "Latest Backup", "Date", "Size"])
-        
-        table.setItem(0, 0, QTableWidgetItem("Production-1"))
-        table.setItem(0, 1, QTableWidgetItem("backup_20240210_120000.zip"))
-        table.setItem(0, 2, QTableWidgetItem("2024-02-10 12:00"))
-        table.setItem(0, 3, QTableWidgetItem("125 MB"))
-        
-        table.setItem(1, 0, QTableWidgetItem("Production-2"))
-        table.setItem(1, 1, QTableWidgetItem("backup_20240210_115000.zip"))
-        table.setItem(1, 2, QTableWidgetItem("2024-02-10 11:50"))
-        table.setItem(1, 3, QTableWidgetItem("130 MB"))
-        
-        layout.addWidget(table)
+        self.group_combo = QComboBox()
+        self.group_combo.addItem("Select target", [])
+        _add_choices(self.group_combo, _target_choices(self.environments, self.groups, singles=True))
+        layout.addWidget(self.group_combo)
+        
+        # Backups to restore, loaded from the API when the dialog opens
+        layout.addWidget(QLabel("Select Backups to Restore:"))
+        
+        self.backups_table = QTableWidget()
+        self.backups_table.setColumnCount(4)
+        self.backups_table.setHorizontalHeaderLabels(["Backup", "Type", "Date", "Files"])
+        self.backups_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.backups_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.backups_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.backups_table)
+        
+        self.status_label = QLabel("Loading backups...")
+        layout.addWidget(self.status_label)
         
         # Configuration types
         layout.addWidget(QLabel("Configuration Types to Restore:"))
@@ -184,6 +308,9 @@ class BulkRestoreDialog(QDialog):
             config_layout.addWidget(check)
         
         config_group.setLayout(config_layout)
+        # The bulk restore endpoint applies each selected backup as a whole
+        config_group.setEnabled(False)
+        config_group.setToolTip("Each selected backup is restored with all of its configuration types")
         layout.addWidget(config_group)
         
         # Options
@@ -191,14 +318,18 @@ class BulkRestoreDialog(QDialog):
         options_group = QGroupBox("")
         options_layout = QVBoxLayout()
         
-        dryrun_check = QCheckBox("Dry-run mode (validate without applying)")
-        dryrun_check.setChecked(True)
-        options_layout.addWidget(dryrun_check)
+        self.dryrun_check = QCheckBox("Dry-run mode (validate without applying)")
+        self.dryrun_check.setChecked(True)
+        options_layout.addWidget(self.dryrun_check)
         
         skip_check = QCheckBox("Skip items that already exist")
+        skip_check.setEnabled(False)
+        skip_check.setToolTip("Not supported by the bulk restore API yet")
         options_layout.addWidget(skip_check)
         
         overwrite_check = QCheckBox("Overwrite existing configurations")
+        overwrite_check.setEnabled(False)
+        overwrite_check.setToolTip("Not supported by the bulk restore API yet")
         options_layout.addWidget(overwrite_check)
         
         options_group.setLayout(options_layout)
@@ -209,7 +340,7 @@ class BulkRestoreDialog(QDialog):
         button_layout.addStretch()
         
         start_btn = QPushButton("▶ Start Bulk Restore")
-        start_btn.clicked.connect(lambda: self._start_restore())
+        start_btn.clicked.connect(self._start_restore)
         button_layout.addWidget(start_btn)
         
         cancel_btn = QPushButton("✕ Cancel")
@@ -221,15 +352,65 @@ class BulkRestoreDialog(QDialog):
         
         self.setLayout(layout)
     
+    def showEvent(self, event):
+        """Load the restorable backups the first time the dialog is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            worker = HttpWorker(default_session(), "GET", f"{self.api_base}/backups/list")
+            worker.signals.finished.connect(self._on_backups_loaded)
+            worker.signals.error.connect(lambda exc: self.status_label.setText(f"Could not load backups: {exc}"))
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_backups_loaded(self, result: tuple):
+        """Fill the table with the completed backups from the API"""
+        status_code, payload, _ = result
+        if status_code != 200 or not isinstance(payload, list):
+            self.status_label.setText(f"Could not load backups: HTTP {status_code}")
+            return
+        backups = [b for b in payload if b.get("status") == "success"]
+        self.set_backups(backups)
+        self.status_label.setText(f"{len(backups)} backups available" if backups else "No completed backups to restore")
+    
+    def set_backups(self, backups: list[dict]):
+        """Show the given backups, keeping each id on its name cell"""
+        # Size the table once, then fill it with a single repaint
+        self.backups_table.setRowCount(len(backups))
+        self.backups_table.setUpdatesEnabled(False)
+        for row, backup in enumerate(backups):
+            created = str(backup.get("created_at") or "")[:16].replace("T", " ")
+            values = (backup.get("name", ""), backup.get("config_type", ""), created, str(backup.get("file_count", 0)))
+            for col, value in enumerate(values):
+                self.backups_table.setItem(row, col, QTableWidgetItem(value))
+            self.backups_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, backup["id"])
+        self.backups_table.setUpdatesEnabled(True)
+    
     def _start_restore(self):
         """Start bulk restore"""
-        QMessageBox.information(self, "Bulk Restore Started", 
-                              "Bulk restore is running across all target environments.\nCheck Bulk Operations tab for details.")
+        target_ids = self.group_combo.currentData() or []
+        if not target_ids:
+            QMessageBox.warning(self, "Bulk Restore", "Select target environments or a group with environments")
+            return
+        rows = sorted({index.row() for index in self.backups_table.selectionModel().selectedRows()})
+        backup_ids = [self.backups_table.item(row, 0).data(Qt.ItemDataRole.UserRole) for row in rows]
+        if not backup_ids:
+            QMessageBox.warning(self, "Bulk Restore", "Select at least one backup to restore")
+            return
+        self.payload = {
+            "name": f"Bulk restore {datetime.now():%Y-%m-%d %H:%M}",
+            "backup_ids": backup_ids,
+            "target_environment_ids": target_ids,
+            "dry_run": self.dryrun_check.isChecked(),
+        }
+        # Progress is reported in the Bulk Operations tab, so don't block here
+        _show_status(self, "Bulk restore started")
         self.accept()
 
 class BulkCompareDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, environments: dict = None):
         super().__init__(parent)
+        self.environments = environments or {}
+        self.payload = None
         self.setWindowTitle("Bulk Compare - Multi-Environment")
         self.setGeometry(100, 100, 600, 500)
         self.init_ui()
@@ -240,27 +421,35 @@ class BulkCompareDialog(QDialog):
         
         # Title
         title = QLabel("Compare Configurations Across Environments")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
+        # Environment the others are compared against
+        layout.addWidget(QLabel("Source Environment:"))
+        self.source_combo = QComboBox()
+        for env_id, env in self.environments.items():
+            self.source_combo.addItem(env.get("name", ""), env_id)
+        layout.addWidget(self.source_combo)
+        
         # Select environments to compare
         layout.addWidget(QLabel("Select Environments to Compare:"))
         
-        list_widget = QListWidget()
-        
-        envs = ["Production-1", "Production-2", "Staging-1", "Staging-2", "Development-1"]
-        for env in envs:
-            item = QListWidgetItem(env)
+        self.targets_list = QListWidget()
+        self.targets_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
+        for env_id, env in self.environments.items():
+            item = QListWidgetItem(env.get("name", ""))
+            item.setData(Qt.ItemDataRole.UserRole, env_id)
+            self.targets_list.addItem(item)
             item.setSelected(True)
-            list_widget.addItem(item)
         
-        layout.addWidget(list_widget)
+        layout.addWidget(self.targets_list)
         
         # Config types
         layout.addWidget(QLabel("Configuration Types:"))
         config_group = QGroupBox("")
         config_layout = QVBoxLayout()
         
+        self.config_checks = []
         for config_type in ["Alerting Rules", "Dashboards", "SLO", "Notifications",
                            "Anomaly Detection", "Auto Tags", "Application Detection Rules",
                            "Service Detection", "Request Attributes", "Metric Events",
@@ -268,6 +457,7 @@ class BulkCompareDialog(QDialog):
             check = QCheckBox(config_type)
             check.setChecked(config_type == "All")
             config_layout.addWidget(check)
+            self.config_checks.append(check)
         
         config_group.setLayout(config_layout)
         layout.addWidget(config_group)
@@ -276,6 +466,8 @@ class BulkCompareDialog(QDialog):
         layout.addWidget(QLabel("Report Format:"))
         format_combo = QComboBox()
         format_combo.addItems(["Summary", "Detailed", "Diff", "CSV Export", "HTML Report"])
+        format_combo.setEnabled(False)
+        format_combo.setToolTip("Comparison results are summarized in the Bulk Operations tab")
         layout.addWidget(format_combo)
         
         # Buttons
@@ -283,7 +475,7 @@ class BulkCompareDialog(QDialog):
         button_layout.addStretch()
         
         start_btn = QPushButton("▶ Start Comparison")
-        start_btn.clicked.connect(lambda: self._start_compare())
+        start_btn.clicked.connect(self._start_compare)
         button_layout.addWidget(start_btn)
         
         cancel_btn = QPushButton("✕ Cancel")
@@ -297,6 +489,25 @@ class BulkCompareDialog(QDialog):
     
     def _start_compare(self):
         """Start bulk comparison"""
-        QMessageBox.information(self, "Comparison Started", 
-                              "Comparing configurations across selected environments.\nResults will be available in Bulk Operations tab.")
+        source_id = self.source_combo.currentData()
+        target_ids = [
+            item.data(Qt.ItemDataRole.UserRole) for item in self.targets_list.selectedItems()
+            if item.data(Qt.ItemDataRole.UserRole) != source_id
+        ]
+        if source_id is None or not target_ids:
+            QMessageBox.warning(self, "Bulk Compare", "Select a source and at least one other environment")
+            return
+        config_types = {_CONFIG_TYPE_KEYS[c.text()] for c in self.config_checks if c.isChecked()}
+        config_type = "all" if "all" in config_types else next(iter(config_types), None)
+        if (len(config_types) > 1 and config_type != "all") or config_type not in _COMPARE_TYPES:
+            QMessageBox.warning(self, "Bulk Compare", "Select one of Alerting Rules, Dashboards or SLO, or All")
+            return
+        self.payload = {
+            "name": f"Bulk compare {datetime.now():%Y-%m-%d %H:%M}",
+            "source_environment_id": source_id,
+            "target_environment_ids": target_ids,
+            "config_type": config_type,
+        }
+        # Progress is reported in the Bulk Operations tab, so don't block here
+        _show_status(self, "Bulk comparison started")
         self.accept()
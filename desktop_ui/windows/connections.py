@@ -1,12 +1,69 @@
 """Connections management window"""
+import os
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
     QTableWidgetItem, QDialog, QLineEdit, QCheckBox, QMessageBox,
-    QHeaderView, QGroupBox
+    QHeaderView, QGroupBox, QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QEvent, QRect, QSize, QThreadPool
 from PyQt6.QtGui import QFont, QColor
 
+from ._common import font
+from ._workers import Worker, default_session
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api")
+
+_STATUS_COLORS = {
+    "healthy": QColor(0, 176, 80),
+    "warning": QColor(230, 150, 0),
+    "error": QColor(255, 0, 0),
+}
+
+_ACTIONS_COLUMN = 4
+
+class _RowActionsDelegate(QStyledItemDelegate):
+    """Paint Edit/Delete/Test buttons in every row of the Actions column without per-row widgets"""
+    LABELS = ("✏ Edit", "🗑 Delete", "🔌 Test")
+    SPACING = 4
+
+    def __init__(self, on_action, parent=None):
+        super().__init__(parent)
+        self._on_action = on_action
+
+    def _button_rects(self, rect: QRect) -> list[QRect]:
+        """Equal-width button rectangles laid out across the cell"""
+        count = len(self.LABELS)
+        inner = rect.adjusted(2, 2, -2, -2)
+        width = (inner.width() - self.SPACING * (count - 1)) // count
+        return [QRect(inner.left() + i * (width + self.SPACING), inner.top(), width, inner.height())
+                for i in range(count)]
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        for label, rect in zip(self.LABELS, self._button_rects(option.rect)):
+            button = QStyleOptionButton()
+            button.rect = rect
+            button.text = label
+            button.state = QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_Raised
+            style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+    def sizeHint(self, option, index):
+        metrics = option.fontMetrics
+        width = max(metrics.horizontalAdvance(label) for label in self.LABELS) + 16
+        count = len(self.LABELS)
+        return QSize(width * count + self.SPACING * (count - 1) + 4, metrics.height() + 12)
+
+    def editorEvent(self, event, model, option, index):
+        """Run the action under the cursor for the row the view resolved from the click"""
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position().toPoint()
+            for action, rect in enumerate(self._button_rects(option.rect)):
+                if rect.contains(pos):
+                    self._on_action(index.row(), action)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
 class ConnectionDialog(QDialog):
     def __init__(self, parent=None, connection=None):
         super().__init__(parent)
@@ -19,7 +76,7 @@ class ConnectionDialog(QDialog):
         
         title_text = "Edit Connection" if self.connection else "New Connection"
         title = QLabel(title_text)
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Name
@@ -79,6 +136,7 @@ class ConnectionDialog(QDialog):
 class ConnectionsWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.api_base = API_BASE_URL
         self.init_ui()
     
     def init_ui(self):
@@ -88,7 +146,7 @@ class ConnectionsWindow(QWidget):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Manage Dynatrace Connections")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(font(14, QFont.Weight.Bold))
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -109,10 +167,13 @@ class ConnectionsWindow(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.connections_table.setItemDelegateForColumn(
+            _ACTIONS_COLUMN, _RowActionsDelegate(self._on_row_action, self.connections_table)
+        )
         
         # Add sample data
-        self._add_connection_row("Production", "https://dyn.example.com/e/abc123", "✓ Healthy", "2 min ago")
-        self._add_connection_row("Staging", "https://dyn-staging.example.com/e/def456", "✓ Healthy", "5 min ago")
+        self._add_connection_row("Production", "https://dyn.example.com/e/abc123", "healthy", "✓ Healthy", "2 min ago")
+        self._add_connection_row("Staging", "https://dyn-staging.example.com/e/def456", "healthy", "✓ Healthy", "5 min ago")
         
         table_layout.addWidget(self.connections_table)
         table_group.setLayout(table_layout)
@@ -134,28 +195,42 @@ class ConnectionsWindow(QWidget):
         delete_btn.clicked.connect(self.delete_connection)
         button_layout.addWidget(delete_btn)
         
-        test_btn = QPushButton("🔌 Test All")
-        test_btn.clicked.connect(self.test_all)
-        button_layout.addWidget(test_btn)
+        self.test_btn = QPushButton("🔌 Test All")
+        self.test_btn.clicked.connect(self.test_all)
+        button_layout.addWidget(self.test_btn)
         
         layout.addLayout(button_layout)
         
         self.setLayout(layout)
     
-    def _add_connection_row(self, name: str, url: str, status: str, last_tested: str):
+    def _add_connection_row(self, name: str, url: str, status_key: str, display_text: str,
+                            last_tested: str, conn_id: int = None):
         """Add a row to the connections table"""
         row = self.connections_table.rowCount()
         self.connections_table.insertRow(row)
         
-        self.connections_table.setItem(row, 0, QTableWidgetItem(name))
+        name_item = QTableWidgetItem(name)
+        name_item.setData(Qt.ItemDataRole.UserRole, conn_id)
+        self.connections_table.setItem(row, 0, name_item)
         self.connections_table.setItem(row, 1, QTableWidgetItem(url))
-        
-        status_item = QTableWidgetItem(status)
-        if "Healthy" in status:
-            status_item.setForeground(QColor(0, 176, 80))
-        self.connections_table.setItem(row, 2, status_item)
-        
+        self._set_connection_status(row, status_key, display_text)
         self.connections_table.setItem(row, 3, QTableWidgetItem(last_tested))
+        actions_item = QTableWidgetItem()
+        actions_item.setFlags(Qt.ItemFlag.ItemIsEnabled)
+        self.connections_table.setItem(row, _ACTIONS_COLUMN, actions_item)
+    
+    def _set_connection_status(self, row: int, status_key: str, display_text: str):
+        """Set the status cell text and its color for the given status key"""
+        status_item = QTableWidgetItem(display_text)
+        color = _STATUS_COLORS.get(status_key)
+        if color:
+            status_item.setForeground(color)
+        self.connections_table.setItem(row, 2, status_item)
+    
+    def _on_row_action(self, row: int, action: int):
+        """Select the clicked row, then run its Edit/Delete/Test action"""
+        self.connections_table.selectRow(row)
+        (self.edit_connection, self.delete_connection, self._test_selected)[action]()
     
     def add_connection(self):
         """Add new connection"""
@@ -194,5 +269,78 @@ class ConnectionsWindow(QWidget):
             QMessageBox.information(self, "Success", "Connection deleted")
     
     def test_all(self):
-        """Test all connections"""
-        QMessageBox.information(self, "Test Results", "All connections are healthy ✓")
+        """Test all connections concurrently off the GUI thread"""
+        self._start_probe(range(self.connections_table.rowCount()))
+    
+    def _test_selected(self):
+        """Test the selected connection"""
+        current_row = self.connections_table.currentRow()
+        if current_row < 0:
+            QMessageBox.warning(self, "Error", "Please select a connection")
+            return
+        self._start_probe([current_row])
+    
+    def _start_probe(self, rows):
+        """Probe the saved connections among the given rows on the thread pool"""
+        conns = []
+        for row in rows:
+            item = self.connections_table.item(row, 0)
+            conn_id = item.data(Qt.ItemDataRole.UserRole)
+            # Rows never saved through the API have nothing to test
+            if conn_id is not None:
+                conns.append((row, conn_id, item.text()))
+        if not conns:
+            QMessageBox.information(self, "Test Results", "No saved connections to test.")
+            return
+        
+        for row, _, _ in conns:
+            self.connections_table.item(row, 2).setText("… Testing")
+        self.test_btn.setEnabled(False)
+        
+        worker = Worker(self._probe_all, conns)
+        worker.signals.finished.connect(self._on_test_all_finished)
+        worker.signals.error.connect(self._on_test_all_error)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _probe_all(self, conns: list) -> list:
+        """Probe every connection in parallel (runs in a worker thread)"""
+        with ThreadPoolExecutor(max_workers=min(16, len(conns))) as ex:
+            return list(ex.map(self._probe_one, conns))
+    
+    def _probe_one(self, conn: tuple) -> tuple:
+        """Probe a single connection; must not touch any widget"""
+        _, conn_id, name = conn
+        try:
+            resp = default_session().post(f"{self.api_base}/dynatrace/connections/{conn_id}/test", timeout=15)
+            if resp.status_code == 200:
+                data = resp.json()
+                if data.get("is_healthy"):
+                    return conn_id, name, "healthy", "Healthy"
+                return conn_id, name, "error", "Unhealthy"
+            return conn_id, name, "error", f"HTTP {resp.status_code}"
+        except Exception as exc:
+            return conn_id, name, "error", f"Error {exc}"
+    
+    def _on_test_all_finished(self, results: list):
+        """Surface per-connection results in the status column"""
+        self.test_btn.setEnabled(True)
+        # Rows may have been deleted while the probes ran, so match results by connection id
+        rows = {
+            self.connections_table.item(row, 0).data(Qt.ItemDataRole.UserRole): row
+            for row in range(self.connections_table.rowCount())
+        }
+        lines = []
+        for conn_id, name, status_key, message in results:
+            lines.append(f"{name}: {message}")
+            row = rows.get(conn_id)
+            if row is None:
+                continue
+            glyph = "✓" if status_key == "healthy" else "✕"
+            self._set_connection_status(row, status_key, f"{glyph} {message}")
+            self.connections_table.setItem(row, 3, QTableWidgetItem("just now"))
+        QMessageBox.information(self, "Test Results", "\n".join(lines))
+    
+    def _on_test_all_error(self, exc: Exception):
+        """Report a failure of the test run itself"""
+        self.test_btn.setEnabled(True)
+        QMessageBox.critical(self, "Test Error", f"Failed to test connections: {exc}")
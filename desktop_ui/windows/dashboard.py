@@ -1,15 +1,162 @@
 """Dashboard window"""
+import os
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTableWidget, QTableWidgetItem, QGroupBox, QHeaderView, QAbstractItemView
+    QTableView, QGroupBox, QHeaderView, QAbstractItemView
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, QThreadPool
+from PyQt6.QtGui import QFont
 from datetime import datetime
 
+from ._common import font
+from ._ticker import get_ticker
+from ._workers import HttpWorker, default_session
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api")
+
+# Stat card label -> (label stylesheet, card stylesheet), formatted once at import
+_STAT_CARDS = {
+    "Total Backups": ("color: #0078d7;", "border: 1px solid #0078d7; border-radius: 5px;"),
+    "Successful": ("color: #00b050;", "border: 1px solid #00b050; border-radius: 5px;"),
+    "Failed": ("color: #ff0000;", "border: 1px solid #ff0000; border-radius: 5px;"),
+    "Total Size": ("color: #9652df;", "border: 1px solid #9652df; border-radius: 5px;"),
+}
+
+def _parse_timestamp(value) -> datetime | None:
+    """Parse an ISO timestamp from the API"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+def _format_size(size_bytes) -> str:
+    """Format a byte count for display"""
+    if size_bytes is None:
+        return "-"
+    size = float(size_bytes)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+class BackupsModel(QAbstractTableModel):
+    """Table model over backup payloads from the API
+
+    DisplayRole returns formatted text; UserRole returns the raw sortable
+    value (epoch seconds, byte count) so the proxy sorts numerically.
+    """
+    HEADERS = ("Name", "Type", "Date", "Status", "Size", "Files")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+        # Per-row UserRole values, computed once so sorting never re-parses timestamps
+        self._sort_keys: list[tuple] = []
+
+    def set_rows(self, rows: list[dict]):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._sort_keys = [self._sort_key(row) for row in self._rows]
+        self.endResetModel()
+
+    @staticmethod
+    def _sort_key(row: dict) -> tuple:
+        """Raw sortable value of each column for one backup"""
+        created = _parse_timestamp(row.get("created_at"))
+        return (
+            row.get("name", ""),
+            row.get("config_type", ""),
+            created.timestamp() if created else 0.0,
+            row.get("status", ""),
+            row.get("size_bytes") or 0,
+            row.get("file_count", 0),
+        )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_value(self._rows[index.row()], index.column())
+        if role == Qt.ItemDataRole.UserRole:
+            return self._sort_keys[index.row()][index.column()]
+        return None
+
+    def _display_value(self, row: dict, col: int) -> str:
+        """Formatted text of one cell"""
+        if col == 0:
+            return row.get("name", "")
+        if col == 1:
+            return row.get("config_type", "")
+        if col == 2:
+            created = _parse_timestamp(row.get("created_at"))
+            return created.strftime("%Y-%m-%d %H:%M") if created else "-"
+        if col == 3:
+            return row.get("status", "")
+        if col == 4:
+            return _format_size(row.get("size_bytes"))
+        if col == 5:
+            return str(row.get("file_count", 0))
+        return ""
+
+class RestoresModel(BackupsModel):
+    """Table model over restore history payloads from the API"""
+    HEADERS = ("Backup", "Date", "Status", "Files", "Error")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Backup id -> name, taken from the backups list so rows show names
+        self.backup_names: dict[int, str] = {}
+
+    def _backup_label(self, row: dict) -> str:
+        backup_id = row.get("backup_id")
+        return self.backup_names.get(backup_id, f"#{backup_id}")
+
+    def _sort_key(self, row: dict) -> tuple:
+        """Raw sortable value of each column for one restore"""
+        restored = _parse_timestamp(row.get("restored_at"))
+        return (
+            self._backup_label(row),
+            restored.timestamp() if restored else 0.0,
+            row.get("status", ""),
+            row.get("file_count") or 0,
+            row.get("error_message") or "",
+        )
+
+    def _display_value(self, row: dict, col: int) -> str:
+        """Formatted text of one cell"""
+        if col == 0:
+            return self._backup_label(row)
+        if col == 1:
+            restored = _parse_timestamp(row.get("restored_at"))
+            return restored.strftime("%Y-%m-%d %H:%M") if restored else "-"
+        if col == 2:
+            return row.get("status", "")
+        if col == 3:
+            return str(row.get("file_count") or 0)
+        if col == 4:
+            return row.get("error_message") or ""
+        return ""
+
 class DashboardWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self._stat_value_labels: dict[str, QLabel] = {}
+        self.api_base = API_BASE_URL
+        self._loaded = False
         self.init_ui()
         self.setup_refresh_timer()
     
@@ -28,7 +175,7 @@ class DashboardWindow(QWidget):
         # Recent backups table
         table_group = QGroupBox("Recent Backups")
         table_layout = QVBoxLayout()
-        self.backups_table = self._create_table()
+        self.backups_table = self._create_table(BackupsModel)
         table_layout.addWidget(self.backups_table)
         table_group.setLayout(table_layout)
         layout.addWidget(table_group)
@@ -36,7 +183,7 @@ class DashboardWindow(QWidget):
         # Recent restores table
         restore_group = QGroupBox("Recent Restores")
         restore_layout = QVBoxLayout()
-        self.restore_table = self._create_table()
+        self.restore_table = self._create_table(RestoresModel)
         restore_layout.addWidget(self.restore_table)
         restore_group.setLayout(restore_layout)
         layout.addWidget(restore_group)
@@ -48,11 +195,15 @@ class DashboardWindow(QWidget):
         layout = QHBoxLayout()
         
         title = QLabel("Dashboard")
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title.setFont(font(16, QFont.Weight.Bold))
         layout.addWidget(title)
         
         layout.addStretch()
         
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.status_label)
+        
         refresh_btn = QPushButton("🔄 Refresh")
         refresh_btn.clicked.connect(self.refresh_data)
         layout.addWidget(refresh_btn)
@@ -64,73 +215,127 @@ class DashboardWindow(QWidget):
         layout = QHBoxLayout()
         
         stats = [
-            ("Total Backups", "12", QColor(0, 120, 215)),
-            ("Successful", "11", QColor(0, 176, 80)),
-            ("Failed", "1", QColor(255, 0, 0)),
-            ("Total Size", "24.5 GB", QColor(150, 82, 223)),
+            ("Total Backups", "-"),
+            ("Successful", "-"),
+            ("Failed", "-"),
+            ("Total Size", "-"),
         ]
         
-        for label, value, color in stats:
-            stat_widget = self._create_stat_card(label, value, color)
+        for label, value in stats:
+            stat_widget = self._create_stat_card(label, value)
             layout.addWidget(stat_widget)
         
         return layout
     
-    def _create_stat_card(self, label: str, value: str, color: QColor) -> QWidget:
+    def _create_stat_card(self, label: str, value: str) -> QWidget:
         """Create a single stat card"""
+        label_style, card_style = _STAT_CARDS[label]
         widget = QWidget()
         layout = QVBoxLayout()
         layout.setContentsMargins(15, 15, 15, 15)
         
         # Label
         label_widget = QLabel(label)
-        label_widget.setFont(QFont("Segoe UI", 9))
-        label_widget.setStyleSheet(f"color: {color.name()};")
+        label_widget.setFont(font(9))
+        label_widget.setStyleSheet(label_style)
         layout.addWidget(label_widget)
         
         # Value
         value_widget = QLabel(value)
-        value_widget.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        value_widget.setFont(font(14, QFont.Weight.Bold))
         layout.addWidget(value_widget)
+        self._stat_value_labels[label] = value_widget
         
         widget.setLayout(layout)
-        widget.setStyleSheet(f"border: 1px solid {color.name()}; border-radius: 5px;")
+        widget.setStyleSheet(card_style)
         
         return widget
     
-    def _create_table(self) -> QTableWidget:
-        """Create a table widget"""
-        table = QTableWidget()
-        table.setColumnCount(6)
-        table.setHorizontalHeaderLabels([
-            "Name", "Type", "Date", "Status", "Size", "Files"
-        ])
+    def _create_table(self, model_class) -> QTableView:
+        """Create a sortable table view over a new model_class instance"""
+        table = QTableView()
+        model = model_class(table)
+        proxy = QSortFilterProxyModel(table)
+        proxy.setSourceModel(model)
+        proxy.setSortRole(Qt.ItemDataRole.UserRole)
+        table.setModel(proxy)
+        table.setSortingEnabled(True)
         
         header = table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        for column in range(1, model.columnCount()):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
         
         table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         
         return table
     
+    def _update_stats(self, stats: dict[str, str]):
+        """Update stat card values in place; the cards are only built once"""
+        for label, value in stats.items():
+            self._stat_value_labels[label].setText(value)
+    
     def refresh_data(self):
         """Refresh dashboard data"""
-        # TODO: Fetch data from API
-        pass
+        self.status_label.clear()
+        self._fetch("backups/stats/overview", self._on_stats_loaded)
+        self._fetch("backups/list", self._on_backups_loaded)
+    
+    def showEvent(self, event):
+        """Load the dashboard data the first time the window is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self.refresh_data()
+    
+    def _fetch(self, path: str, on_loaded):
+        """GET an API resource on the thread pool and hand the payload to on_loaded"""
+        worker = HttpWorker(default_session(), "GET", f"{self.api_base}/{path}")
+        worker.signals.finished.connect(lambda result: self._on_fetched(path, result, on_loaded))
+        worker.signals.error.connect(lambda exc: self._on_fetch_error(path, exc))
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_fetched(self, path: str, result: tuple, on_loaded):
+        """Pass a successful response on; on failure the last values stay until the next tick"""
+        status_code, payload, _ = result
+        if status_code == 200 and payload is not None:
+            on_loaded(payload)
+        else:
+            self._on_fetch_error(path, f"HTTP {status_code}")
+    
+    def _on_fetch_error(self, path: str, error):
+        """Report a failed fetch in the header"""
+        self.status_label.setText(f"⚠ Could not load {path}")
+        self.status_label.setToolTip(str(error))
+    
+    def _on_backups_loaded(self, backups: list):
+        """Fill the backups table, then the restores table that names its backups"""
+        self.backups_table.model().sourceModel().set_rows(backups)
+        restores = self.restore_table.model().sourceModel()
+        restores.backup_names = {b.get("id"): b.get("name", "") for b in backups}
+        self._fetch("restore/history", restores.set_rows)
+    
+    def _on_stats_loaded(self, stats: dict):
+        """Show the API's backup statistics on the stat cards"""
+        if not stats:
+            # The API answers {} when it could not compute them
+            return
+        self._update_stats({
+            "Total Backups": str(stats.get("total_backups", 0)),
+            "Successful": str(stats.get("successful_backups", 0)),
+            "Failed": str(stats.get("failed_backups", 0)),
+            "Total Size": f"{stats.get('total_size_gb', 0):.1f} GB",
+        })
     
     def setup_refresh_timer(self):
-        """Setup auto-refresh timer"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh_data)
-        self.timer.start(30000)  # Refresh every 30 seconds
+        """Subscribe to the shared 30-second refresh tick"""
+        get_ticker().tick_30s.connect(self.refresh_data)
     
     def closeEvent(self, event):
         """Clean up on close"""
-        self.timer.stop()
+        try:
+            get_ticker().tick_30s.disconnect(self.refresh_data)
+        except TypeError:
+            pass
         super().closeEvent(event)
@@ -1,37 +1,348 @@
 """Environments management window"""
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache, partial
 import requests
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
-    QTableWidgetItem, QDialog, QLineEdit, QCheckBox, QMessageBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView,
+    QDialog, QLineEdit, QCheckBox, QMessageBox,
     QHeaderView, QGroupBox, QComboBox, QListWidget, QListWidgetItem,
     QTabWidget, QTextEdit, QSpinBox, QProgressBar
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import (
+    Qt, QTimer, QThreadPool, QObject, QRunnable, QAbstractTableModel, QModelIndex, pyqtSignal
+)
+from PyQt6.QtGui import QFont, QColor, QBrush
 
-from .bulk_operations import BulkBackupDialog, BulkRestoreDialog, BulkCompareDialog
+from ._common import font, icon
+from ._workers import HttpWorker, default_session, json_loads, make_session
+from .bulk_operations import BulkBackupDialog, BulkRestoreDialog, BulkCompareDialog, BulkOperationWorker
 
 API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api")
 
+# Preset column widths (px); sizing to contents would measure every row
+_ENV_COLUMN_WIDTHS = {0: 140, 1: 100, 3: 90, 4: 160, 5: 110}
+_GROUP_COLUMN_WIDTHS = {0: 140, 2: 100, 3: 120}
+_OPERATION_COLUMN_WIDTHS = {0: 160, 1: 90, 2: 100, 3: 90, 4: 130}
+_ROW_HEIGHT = 24
+_REFRESH_INTERVAL_MS = 30000
+
+# Save-time validation; Managed URLs end in /e/<environment id>, SaaS URLs are host only
+_URL_RE = re.compile(r"^https?://[^/\s]+(/e/[A-Za-z0-9_-]+)?/?$")
+_TOKEN_RE = re.compile(r"^dt0[a-z]\d{2}\.[A-Z0-9]{24}\.[A-Z0-9]{64}$")
+
+# API deployment_type values mapped to the dialog's combo labels
+_DEPLOYMENT_LABELS = {"managed": "Managed", "saas": "SaaS"}
+
+# Shared status brushes, returned from data() instead of allocating per cell
+_HEALTHY_BRUSH = QBrush(QColor(0, 176, 80))
+_UNHEALTHY_BRUSH = QBrush(QColor(200, 0, 0))
+_OPERATION_STATUS_BRUSHES = {
+    "success": _HEALTHY_BRUSH,
+    "completed": _HEALTHY_BRUSH,
+    "in_progress": _HEALTHY_BRUSH,
+    "pending": _HEALTHY_BRUSH,
+    "failed": _UNHEALTHY_BRUSH,
+    "error": _UNHEALTHY_BRUSH,
+}
+
+
+@lru_cache(maxsize=4096)
+def _fmt_iso(value: str) -> str:
+    """Format an API ISO timestamp; the same strings come back on every refresh"""
+    try:
+        # FastAPI returns ISO string
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return value
+
+
+def _apply_column_widths(table: QTableView, widths: dict, stretch_column: int):
+    """Use fixed row heights and interactive preset-width columns, stretching one column"""
+    header = table.horizontalHeader()
+    for column, width in widths.items():
+        header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+        header.resizeSection(column, width)
+    header.setSectionResizeMode(stretch_column, QHeaderView.ResizeMode.Stretch)
+    
+    vertical = table.verticalHeader()
+    vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vertical.setDefaultSectionSize(_ROW_HEIGHT)
+
+
+class _RowsModel(QAbstractTableModel):
+    """Read-only table model over a list of display tuples, one API id per row"""
+    HEADERS: tuple = ()
+    STATUS_COLUMN = -1
+    FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[tuple] = []
+        self._ids: list = []
+        # Per-cell role values, rebuilt only when rows change so painting is a list lookup
+        self._display: list[tuple] = []
+        self._foreground: list[tuple] = []
+        # Row hashes let a refresh skip rows whose content has not changed
+        self._hashes: list[int] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return self.FLAGS
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[index.row()][index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground[index.row()][index.column()]
+        return None
+
+    def status_color(self, status: str):
+        """Foreground color for the status column, or None for the default"""
+        return None
+
+    def row_id(self, row: int):
+        """API id of the given row"""
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def row_for_id(self, row_id) -> int:
+        """Row currently holding the given API id, or -1"""
+        try:
+            return self._ids.index(row_id)
+        except ValueError:
+            return -1
+
+    def set_value(self, row: int, column: int, value):
+        """Change one cell in place and notify only that cell"""
+        values = list(self._rows[row])
+        values[column] = value
+        self._store_row(row, tuple(values))
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole])
+
+    def sync_rows(self, rows: list[tuple], ids: list):
+        """Bring the model in line with a fresh payload without a reset
+
+        Rows whose id disappeared are removed, rows whose content hash changed
+        are updated in place and new ids are appended; an unchanged payload
+        emits no notifications at all.
+        """
+        incoming = dict(zip(ids, rows))
+        for row in range(len(self._ids) - 1, -1, -1):
+            if self._ids[row] not in incoming:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                for column in (self._rows, self._ids, self._display, self._foreground, self._hashes):
+                    del column[row]
+                self.endRemoveRows()
+        
+        last_column = len(self.HEADERS) - 1
+        for row, row_id in enumerate(self._ids):
+            values = incoming.pop(row_id)
+            if hash(values) != self._hashes[row]:
+                self._store_row(row, values)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+        
+        if incoming:
+            self.extend_rows(list(incoming.values()), list(incoming))
+
+    def set_rows(self, rows: list[tuple], ids: list):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._ids = list(ids)
+        self._update_caches(0)
+        self.endResetModel()
+
+    def extend_rows(self, rows: list[tuple], ids: list):
+        """Append rows with a single insert notification"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._ids.extend(ids)
+        self._update_caches(first)
+        self.endInsertRows()
+
+    def add_row(self, row_id, values: tuple):
+        """Append one row"""
+        self.extend_rows([values], [row_id])
+
+    def remove_row(self, row: int):
+        """Remove one row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._ids[row]
+        self._update_caches(0)
+        self.endRemoveRows()
+
+    def clear(self):
+        """Remove all rows"""
+        self.set_rows([], [])
+
+    def _update_caches(self, first: int):
+        """Rebuild the per-cell role caches for rows from ``first`` on"""
+        del self._display[first:]
+        del self._foreground[first:]
+        del self._hashes[first:]
+        for values in self._rows[first:]:
+            display, foreground = self._cache_row(values)
+            self._display.append(display)
+            self._foreground.append(foreground)
+            self._hashes.append(hash(values))
+
+    def _store_row(self, row: int, values: tuple):
+        """Replace one row's values and its cached role data"""
+        self._rows[row] = values
+        self._display[row], self._foreground[row] = self._cache_row(values)
+        self._hashes[row] = hash(values)
+
+    def _cache_row(self, values: tuple) -> tuple:
+        """Display and foreground tuples for one row"""
+        columns = len(self.HEADERS)
+        display = tuple(values[:columns]) + ("",) * (columns - len(values))
+        foreground = tuple(
+            self.status_color(value) if col == self.STATUS_COLUMN else None
+            for col, value in enumerate(display)
+        )
+        return display, foreground
+
+
+class EnvironmentsModel(_RowsModel):
+    HEADERS = ("Name", "Type", "URL", "Status", "Tags", "Last Tested")
+    STATUS_COLUMN = 3
+
+    def status_color(self, status: str):
+        return _HEALTHY_BRUSH if status == "Healthy" else _UNHEALTHY_BRUSH
+
+    def update_status(self, row: int, status: str):
+        """Set one environment's status cell"""
+        self.set_value(row, self.STATUS_COLUMN, status)
+
+
+class GroupsModel(_RowsModel):
+    HEADERS = ("Name", "Description", "Members", "Actions")
+
+
+class OperationsModel(_RowsModel):
+    HEADERS = ("Operation", "Type", "Environments", "Status", "Created", "Results")
+    STATUS_COLUMN = 3
+
+    def status_color(self, status: str):
+        return _OPERATION_STATUS_BRUSHES.get(status)
+
+
+class TestResultsModel(_RowsModel):
+    HEADERS = ("Environment", "Result", "Details")
+    STATUS_COLUMN = 1
+
+    def status_color(self, status: str):
+        return _HEALTHY_BRUSH if status == "Passed" else _UNHEALTHY_BRUSH
+
+
+class TestResultsDialog(QDialog):
+    """Single summary of a connection test run across many environments"""
+    def __init__(self, parent=None, results: list[tuple] = ()):
+        super().__init__(parent)
+        self.setWindowTitle("Test Results")
+        self.setMinimumSize(520, 300)
+        
+        passed = sum(1 for _, ok, _ in results if ok)
+        model = TestResultsModel(self)
+        model.set_rows(
+            [(name, "Passed" if ok else "Failed", detail) for name, ok, detail in results],
+            list(range(len(results))),
+        )
+        
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(f"{passed} of {len(results)} environments passed"))
+        table = QTableView()
+        table.setModel(model)
+        table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        _apply_column_widths(table, {0: 160, 1: 80}, 2)
+        layout.addWidget(table)
+        
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        layout.addWidget(close_btn, alignment=Qt.AlignmentFlag.AlignRight)
+        self.setLayout(layout)
+
+
+class EnvTestSignals(QObject):
+    tested = pyqtSignal(object)
+    finished = pyqtSignal(list)
+
+
+class EnvTestWorker(QRunnable):
+    """Test environment connections concurrently, reporting each result as soon as it returns
+
+    ``tested`` carries ``(env_id, name, ok, detail)`` per environment and
+    ``finished`` the full list once every environment has been tried.
+    """
+    def __init__(self, api_base: str, environments: dict, session: requests.Session):
+        super().__init__()
+        self.api_base = api_base
+        self.session = session
+        self.environments = environments
+        self.signals = EnvTestSignals()
+
+    def run(self):
+        results = []
+        with ThreadPoolExecutor(max_workers=min(8, len(self.environments))) as ex:
+            futures = {
+                ex.submit(self._test, env_id, env.get("name")): env_id
+                for env_id, env in self.environments.items()
+            }
+            for future in as_completed(futures):
+                result = (futures[future], *future.result())
+                results.append(result)
+                self.signals.tested.emit(result)
+        self.signals.finished.emit(results)
+
+    def _test(self, env_id, name) -> tuple:
+        try:
+            resp = self.session.post(f"{self.api_base}/environments/{env_id}/test", timeout=15)
+            if resp.status_code == 200:
+                data = json_loads(resp.content)
+                ok = bool(data.get("is_healthy"))
+                return name, ok, data.get("message") or ("Healthy" if ok else "Unhealthy")
+            return name, False, f"HTTP {resp.status_code}"
+        except Exception as exc:
+            return name, False, f"Error {exc}"
+
 
 class EnvironmentDialog(QDialog):
-    def __init__(self, parent=None, environment=None, api_base: str = API_BASE_URL):
+    def __init__(self, parent=None, environment=None, api_base: str = API_BASE_URL,
+                 session: requests.Session | None = None):
         super().__init__(parent)
         self.environment = environment
         self.api_base = api_base
+        self.session = session if session is not None else default_session()
         self.result_data = None
         self.init_ui()
+        self.reset(environment)
 
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
         
-        title_text = "Edit Environment" if self.environment else "New Environment"
-        title = QLabel(title_text)
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        layout.addWidget(title)
+        self.title_label = QLabel()
+        self.title_label.setFont(font(12, QFont.Weight.Bold))
+        layout.addWidget(self.title_label)
         
         # Name
         layout.addWidget(QLabel("Name:"))
@@ -79,38 +390,19 @@ class EnvironmentDialog(QDialog):
         self.insecure_check = QCheckBox("Allow insecure SSL certificates (for test environments)")
         layout.addWidget(self.insecure_check)
 
-        # Prefill if editing
-        if self.environment:
-            self.name_input.setText(self.environment.get("name", ""))
-            env_type = self.environment.get("env_type", "production")
-            idx = self.type_combo.findText(env_type.capitalize())
-            if idx >= 0:
-                self.type_combo.setCurrentIndex(idx)
-            self.url_input.setText(self.environment.get("environment_url", ""))
-            self.token_input.setText(self.environment.get("api_token", ""))
-            tags = self.environment.get("tags") or []
-            self.tags_input.setText(", ".join(tags))
-            self.insecure_check.setChecked(bool(self.environment.get("insecure_ssl")))
-            deployment = self.environment.get("deployment_type", "managed").capitalize()
-            if deployment not in ["Managed", "Saas"]:
-                deployment = "Managed"
-            self.deployment_combo.setCurrentText(deployment)
-        else:
-            self._update_url_placeholder("Managed")
-        
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
         
-        save_btn = QPushButton("✓ Save")
+        save_btn = QPushButton(icon("save"), "Save")
         save_btn.clicked.connect(self.save)
         button_layout.addWidget(save_btn)
         
-        test_btn = QPushButton("🔌 Test Connection")
+        test_btn = QPushButton(icon("connect"), "Test Connection")
         test_btn.clicked.connect(self.test_connection)
         button_layout.addWidget(test_btn)
         
-        cancel_btn = QPushButton("✕ Cancel")
+        cancel_btn = QPushButton(icon("cancel"), "Cancel")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         
@@ -119,11 +411,55 @@ class EnvironmentDialog(QDialog):
         self.setLayout(layout)
         self.setGeometry(100, 100, 450, 450)
 
+    def reset(self, environment=None):
+        """Clear the form and prefill it from ``environment`` when editing"""
+        self.environment = environment
+        self.result_data = None
+        self.title_label.setText("Edit Environment" if environment else "New Environment")
+        
+        self.name_input.clear()
+        self.url_input.clear()
+        self.token_input.clear()
+        self.tags_input.clear()
+        self.type_combo.setCurrentIndex(0)
+        self.deployment_combo.setCurrentIndex(0)
+        self.insecure_check.setChecked(False)
+        self._update_url_placeholder("Managed")
+        
+        # Prefill if editing
+        if environment:
+            self.name_input.setText(environment.get("name", ""))
+            env_type = environment.get("env_type", "production")
+            idx = self.type_combo.findText(env_type.capitalize())
+            if idx >= 0:
+                self.type_combo.setCurrentIndex(idx)
+            self.url_input.setText(environment.get("environment_url", ""))
+            self.token_input.setText(environment.get("api_token", ""))
+            tags = environment.get("tags") or []
+            self.tags_input.setText(", ".join(tags))
+            self.insecure_check.setChecked(bool(environment.get("insecure_ssl")))
+            deployment = (environment.get("deployment_type") or "managed").lower()
+            self.deployment_combo.setCurrentText(_DEPLOYMENT_LABELS.get(deployment, "Managed"))
+
+    def _update_url_placeholder(self, deployment: str):
+        """Adjust URL placeholder depending on deployment type"""
+        if deployment.lower() == "saas":
+            self.url_input.setPlaceholderText("https://abc12345.live.dynatrace.com")
+        else:
+            self.url_input.setPlaceholderText("https://dynatrace.example.com/e/12345678")
+
     def save(self):
         """Save environment"""
         if not self.name_input.text() or not self.url_input.text() or not self.token_input.text():
             QMessageBox.warning(self, "Validation Error", "Please fill all required fields")
             return
+        if not _URL_RE.match(self.url_input.text().strip()):
+            QMessageBox.warning(self, "Validation Error", "Environment URL must look like https://host or https://host/e/<environment-id>")
+            return
+        token = self.token_input.text().strip()
+        if token.startswith("dt0") and not _TOKEN_RE.match(token):
+            QMessageBox.warning(self, "Validation Error", "API token is malformed; expected dt0c01.<24 chars>.<64 chars>")
+            return
         tags = [t.strip() for t in self.tags_input.text().split(",") if t.strip()]
         deployment_type = self.deployment_combo.currentText().lower()
         self.result_data = {
@@ -145,17 +481,24 @@ class EnvironmentDialog(QDialog):
             return
         
         env_id = self.environment["id"]
-        try:
-            resp = requests.post(f"{self.api_base}/environments/{env_id}/test", timeout=10)
-            if resp.status_code == 200:
-                data = resp.json()
-                status = "Healthy" if data.get("is_healthy") else "Unhealthy"
-                QMessageBox.information(self, "Test Connection", f"{status}: {data.get('message', '')}")
-            else:
-                QMessageBox.warning(self, "Test Failed", f"HTTP {resp.status_code}: {resp.text}")
-        except Exception as exc:
-            QMessageBox.critical(self, "Test Error", f"Failed to test connection: {exc}")
+        worker = HttpWorker(self.session, "POST", f"{self.api_base}/environments/{env_id}/test")
+        worker.signals.finished.connect(self._on_test_finished)
+        worker.signals.error.connect(self._on_test_error)
+        QThreadPool.globalInstance().start(worker)
 
+    def _on_test_finished(self, result: tuple):
+        """Show the outcome of a connection test"""
+        status_code, payload, _ = result
+        payload = payload or {}
+        if status_code == 200:
+            status = "Healthy" if payload.get("is_healthy") else "Unhealthy"
+            QMessageBox.information(self, "Test Connection", f"{status}: {payload.get('message', '')}")
+        else:
+            QMessageBox.warning(self, "Test Failed", f"HTTP {status_code}: {payload}")
+
+    def _on_test_error(self, exc: Exception):
+        """Report a connection test that never reached the API"""
+        QMessageBox.critical(self, "Test Error", f"Failed to test connection: {exc}")
 
 class GroupDialog(QDialog):
     def __init__(self, parent=None, group=None):
@@ -168,7 +511,7 @@ class GroupDialog(QDialog):
         layout = QVBoxLayout()
         title_text = "Edit Group" if self.group else "New Group"
         title = QLabel(title_text)
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
 
         layout.addWidget(QLabel("Name:"))
@@ -192,10 +535,10 @@ class GroupDialog(QDialog):
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
-        save_btn = QPushButton("✓ Save")
+        save_btn = QPushButton(icon("save"), "Save")
         save_btn.clicked.connect(self.save)
         button_layout.addWidget(save_btn)
-        cancel_btn = QPushButton("✕ Cancel")
+        cancel_btn = QPushButton(icon("cancel"), "Cancel")
         cancel_btn.clicked.connect(self.reject)
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
@@ -211,8 +554,9 @@ class GroupDialog(QDialog):
             return
         env_ids = []
         if env_ids_text:
+            tokens = (t for t in (x.strip() for x in env_ids_text.split(",")) if t)
             try:
-                env_ids = [int(x.strip()) for x in env_ids_text.split(",") if x.strip()]
+                env_ids = list(map(int, tokens))
             except ValueError:
                 QMessageBox.warning(self, "Validation Error", "Environment IDs must be integers separated by commas")
                 return
@@ -227,34 +571,65 @@ class EnvironmentsWindow(QWidget):
     def __init__(self):
         super().__init__()
         self.api_base = API_BASE_URL
+        self.session = make_session()
         self.environments_cache = {}
         self.groups_cache = {}
+        # (method, url) of list GETs on the thread pool; a GET is not resubmitted while in flight
+        self._inflight: set[tuple] = set()
+        # Open modal dialogs holding off timed refreshes; see _paused_refresh
+        self._refresh_pauses = 0
+        # Last ETag per list URL; a 304 answer means the table is already current
+        self._etags: dict[str, str] = {}
+        # Bulk operation workers still polling; cancelled when the window closes
+        self._bulk_workers: set = set()
+        # One message box reused for every success notification
+        self._info_box = QMessageBox(self)
+        self._info_box.setIcon(QMessageBox.Icon.Information)
+        # Environment add/edit dialog, built on first use and reset between opens
+        self._env_dialog = None
+        # Models outlive their views so refreshes can fill tabs that are not built yet
+        self.env_model = EnvironmentsModel(self)
+        self.groups_model = GroupsModel(self)
+        self.operations_model = OperationsModel(self)
         self.init_ui()
         self.setup_refresh_timer()
-        self.refresh_data()
     
     def init_ui(self):
         """Initialize UI"""
         layout = QVBoxLayout()
         
         # Create tabs
-        tabs = QTabWidget()
+        self.tabs = QTabWidget()
         
         # Environments tab
         env_tab = self._create_environments_tab()
-        tabs.addTab(env_tab, "Environments")
+        self.tabs.addTab(env_tab, "Environments")
         
-        # Groups tab
-        groups_tab = self._create_groups_tab()
-        tabs.addTab(groups_tab, "Environment Groups")
+        # Groups and Bulk Operations tabs are built on first activation
+        self.tabs.addTab(QWidget(), "Environment Groups")
+        self.tabs.addTab(QWidget(), "Bulk Operations")
+        self._tab_builders = {1: self._create_groups_tab, 2: self._create_bulk_operations_tab}
+        self._tab_refreshers = {0: self._refresh_envs, 1: self._refresh_groups, 2: self._refresh_bulk}
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
-        # Bulk Operations tab
-        bulk_tab = self._create_bulk_operations_tab()
-        tabs.addTab(bulk_tab, "Bulk Operations")
-        
-        layout.addWidget(tabs)
+        layout.addWidget(self.tabs)
         self.setLayout(layout)
     
+    def _on_tab_changed(self, index: int):
+        """Replace a placeholder tab with its real content the first time it is shown"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        placeholder = self.tabs.widget(index)
+        label = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, builder(), label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        self._tab_refreshers[index]()
+    
     def _create_environments_tab(self) -> QWidget:
         """Create environments management tab"""
         widget = QWidget()
@@ -263,7 +638,7 @@ class EnvironmentsWindow(QWidget):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Dynatrace Environments (Multi-Tenant)")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(font(14, QFont.Weight.Bold))
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -272,19 +647,10 @@ class EnvironmentsWindow(QWidget):
         table_group = QGroupBox("Available Environments")
         table_layout = QVBoxLayout()
         
-        self.environments_table = QTableWidget()
-        self.environments_table.setColumnCount(6)
-        self.environments_table.setHorizontalHeaderLabels([
-            "Name", "Type", "URL", "Status", "Tags", "Last Tested"
-        ])
+        self.environments_table = QTableView()
+        self.environments_table.setModel(self.env_model)
         
-        header = self.environments_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
+        _apply_column_widths(self.environments_table, _ENV_COLUMN_WIDTHS, stretch_column=2)
 
         table_layout.addWidget(self.environments_table)
         table_group.setLayout(table_layout)
@@ -302,13 +668,13 @@ class EnvironmentsWindow(QWidget):
         edit_btn.clicked.connect(self.edit_environment)
         button_layout.addWidget(edit_btn)
         
-        delete_btn = QPushButton("🗑 Delete")
+        delete_btn = QPushButton(icon("trash"), "Delete")
         delete_btn.clicked.connect(self.delete_environment)
         button_layout.addWidget(delete_btn)
         
-        test_btn = QPushButton("🔌 Test All")
-        test_btn.clicked.connect(self.test_all_environments)
-        button_layout.addWidget(test_btn)
+        self.test_all_btn = QPushButton(icon("connect"), "Test All")
+        self.test_all_btn.clicked.connect(self.test_all_environments)
+        button_layout.addWidget(self.test_all_btn)
         
         layout.addLayout(button_layout)
         
@@ -321,24 +687,17 @@ class EnvironmentsWindow(QWidget):
         layout = QVBoxLayout()
         
         title = QLabel("Environment Groups (for bulk operations)")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Groups table
         table_group = QGroupBox("Groups")
         table_layout = QVBoxLayout()
         
-        self.groups_table = QTableWidget()
-        self.groups_table.setColumnCount(4)
-        self.groups_table.setHorizontalHeaderLabels([
-            "Name", "Description", "Members", "Actions"
-        ])
+        self.groups_table = QTableView()
+        self.groups_table.setModel(self.groups_model)
         
-        header = self.groups_table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        _apply_column_widths(self.groups_table, _GROUP_COLUMN_WIDTHS, stretch_column=1)
 
         table_layout.addWidget(self.groups_table)
         table_group.setLayout(table_layout)
@@ -356,7 +715,7 @@ class EnvironmentsWindow(QWidget):
         edit_btn.clicked.connect(self.edit_group)
         button_layout.addWidget(edit_btn)
         
-        delete_btn = QPushButton("🗑 Delete")
+        delete_btn = QPushButton(icon("trash"), "Delete")
         delete_btn.clicked.connect(self.delete_group)
         button_layout.addWidget(delete_btn)
         
@@ -371,7 +730,7 @@ class EnvironmentsWindow(QWidget):
         layout = QVBoxLayout()
         
         title = QLabel("Bulk Operations")
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Description
@@ -382,17 +741,17 @@ class EnvironmentsWindow(QWidget):
         buttons_group = QGroupBox("Quick Actions")
         buttons_layout = QVBoxLayout()
         
-        bulk_backup_btn = QPushButton("📦 Bulk Backup")
+        bulk_backup_btn = QPushButton(icon("backup"), "Bulk Backup")
         bulk_backup_btn.setMinimumHeight(50)
         bulk_backup_btn.clicked.connect(self.bulk_backup)
         buttons_layout.addWidget(bulk_backup_btn)
         
-        bulk_restore_btn = QPushButton("♻️ Bulk Restore")
+        bulk_restore_btn = QPushButton(icon("restore"), "Bulk Restore")
         bulk_restore_btn.setMinimumHeight(50)
         bulk_restore_btn.clicked.connect(self.bulk_restore)
         buttons_layout.addWidget(bulk_restore_btn)
         
-        bulk_compare_btn = QPushButton("🔍 Bulk Compare")
+        bulk_compare_btn = QPushButton(icon("compare"), "Bulk Compare")
         bulk_compare_btn.setMinimumHeight(50)
         bulk_compare_btn.clicked.connect(self.bulk_compare)
         buttons_layout.addWidget(bulk_compare_btn)
@@ -400,15 +759,19 @@ class EnvironmentsWindow(QWidget):
         buttons_group.setLayout(buttons_layout)
         layout.addWidget(buttons_group)
         
+        # Progress of the operation launched from this tab
+        self.bulk_status_label = QLabel("No bulk operation running")
+        layout.addWidget(self.bulk_status_label)
+        self.bulk_progress = QProgressBar()
+        layout.addWidget(self.bulk_progress)
+        
         # History
         history_group = QGroupBox("Operation History")
         history_layout = QVBoxLayout()
         
-        self.operations_table = QTableWidget()
-        self.operations_table.setColumnCount(6)
-        self.operations_table.setHorizontalHeaderLabels([
-            "Operation", "Type", "Environments", "Status", "Created", "Results"
-        ])
+        self.operations_table = QTableView()
+        self.operations_table.setModel(self.operations_model)
+        _apply_column_widths(self.operations_table, _OPERATION_COLUMN_WIDTHS, stretch_column=5)
         
         history_layout.addWidget(self.operations_table)
         history_group.setLayout(history_layout)
@@ -419,54 +782,51 @@ class EnvironmentsWindow(QWidget):
         widget.setLayout(layout)
         return widget
     
-    def _add_environment_row(self, env: dict):
-        """Add environment row from API payload"""
-        row = self.environments_table.rowCount()
-        self.environments_table.insertRow(row)
-
-        name_item = QTableWidgetItem(env.get("name", ""))
-        name_item.setData(Qt.ItemDataRole.UserRole, env.get("id"))
-        self.environments_table.setItem(row, 0, name_item)
-
-        self.environments_table.setItem(row, 1, QTableWidgetItem(env.get("env_type", "")))
-        self.environments_table.setItem(row, 2, QTableWidgetItem(env.get("environment_url", "")))
-
-        status_label = "Healthy" if env.get("is_healthy") else "Unhealthy"
-        status_item = QTableWidgetItem(status_label)
-        status_item.setForeground(QColor(0, 176, 80) if env.get("is_healthy") else QColor(200, 0, 0))
-        self.environments_table.setItem(row, 3, status_item)
-
+    def _environment_row(self, env: dict) -> tuple:
+        """Display values for one environment from the API payload"""
         tags = env.get("tags") or []
-        self.environments_table.setItem(row, 4, QTableWidgetItem(", ".join(tags)))
-        self.environments_table.setItem(row, 5, QTableWidgetItem(self._format_last_tested(env.get("last_tested_at"))))
+        return (
+            env.get("name", ""),
+            env.get("env_type", ""),
+            env.get("environment_url", ""),
+            "Healthy" if env.get("is_healthy") else "Unhealthy",
+            ", ".join(tags),
+            self._format_last_tested(env.get("last_tested_at")),
+        )
     
-    def _add_group_row(self, name: str, description: str, members: str):
-        """Add group row"""
-        row = self.groups_table.rowCount()
-        self.groups_table.insertRow(row)
-        
-        item = QTableWidgetItem(name)
-        self.groups_table.setItem(row, 0, item)
-        self.groups_table.setItem(row, 1, QTableWidgetItem(description))
-        self.groups_table.setItem(row, 2, QTableWidgetItem(members))
+    def _group_row(self, group: dict) -> tuple:
+        """Display values for one group from the API payload"""
+        members = group.get("environment_ids") or []
+        return (group.get("name", ""), group.get("description") or "", f"{len(members)} members")
+    
+    def _operation_row(self, op: dict) -> tuple:
+        """Display values for one bulk operation from the API payload"""
+        return (
+            op.get("name", ""),
+            op.get("operation_type", ""),
+            str(op.get("total_environments", 0)),
+            op.get("status", ""),
+            self._format_last_tested(op.get("created_at")),
+            str(op.get("results_summary") or {}),
+        )
+    
+    def _get_env_dialog(self) -> EnvironmentDialog:
+        """Return the shared environment dialog, creating it on first use"""
+        if self._env_dialog is None:
+            self._env_dialog = EnvironmentDialog(self, api_base=self.api_base, session=self.session)
+        return self._env_dialog
     
     def add_environment(self):
         """Add new environment"""
-        dialog = EnvironmentDialog(self, api_base=self.api_base)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            try:
-                resp = requests.post(
-                    f"{self.api_base}/environments",
+        dialog = self._get_env_dialog()
+        dialog.reset()
+        with self._paused_refresh():
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self._submit(
+                    "POST", f"{self.api_base}/environments",
+                    partial(self._on_saved, "Environment added successfully", "Failed to add environment"),
                     json=dialog.result_data,
-                    timeout=10,
                 )
-                if resp.status_code == 200:
-                    QMessageBox.information(self, "Success", "Environment added successfully")
-                    self.refresh_data()
-                else:
-                    QMessageBox.warning(self, "Error", f"Failed to add environment: {resp.text}")
-            except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Request failed: {exc}")
     
     def edit_environment(self):
         """Edit selected environment"""
@@ -476,21 +836,15 @@ class EnvironmentsWindow(QWidget):
             return
 
         current_env = self.environments_cache.get(env_id, {})
-        dialog = EnvironmentDialog(self, environment=current_env, api_base=self.api_base)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            try:
-                resp = requests.put(
-                    f"{self.api_base}/environments/{env_id}",
+        dialog = self._get_env_dialog()
+        dialog.reset(current_env)
+        with self._paused_refresh():
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self._submit(
+                    "PUT", f"{self.api_base}/environments/{env_id}",
+                    partial(self._on_saved, "Environment updated successfully", "Failed to update environment"),
                     json=dialog.result_data,
-                    timeout=10,
                 )
-                if resp.status_code == 200:
-                    QMessageBox.information(self, "Success", "Environment updated successfully")
-                    self.refresh_data()
-                else:
-                    QMessageBox.warning(self, "Error", f"Failed to update environment: {resp.text}")
-            except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Request failed: {exc}")
     
     def delete_environment(self):
         """Delete selected environment"""
@@ -499,60 +853,67 @@ class EnvironmentsWindow(QWidget):
             QMessageBox.warning(self, "Error", "Please select an environment")
             return
 
-        reply = QMessageBox.question(
-            self,
-            "Confirm Delete",
-            "Are you sure you want to delete this environment?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
+        with self._paused_refresh():
+            reply = QMessageBox.question(
+                self,
+                "Confirm Delete",
+                "Are you sure you want to delete this environment?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                resp = requests.delete(f"{self.api_base}/environments/{env_id}", timeout=10)
-                if resp.status_code == 200:
-                    QMessageBox.information(self, "Success", "Environment deleted")
-                    self.refresh_data()
-                else:
-                    QMessageBox.warning(self, "Error", f"Failed to delete environment: {resp.text}")
-            except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Request failed: {exc}")
+            if reply == QMessageBox.StandardButton.Yes:
+                self._submit(
+                    "DELETE", f"{self.api_base}/environments/{env_id}",
+                    partial(self._on_saved, "Environment deleted", "Failed to delete environment"),
+                )
     
     def test_all_environments(self):
         """Test all environment connections"""
         if not self.environments_cache:
-            QMessageBox.information(self, "Test Results", "No environments to test.")
+            self._show_info("No environments to test.", "Test Results")
             return
-        results = []
-        for env_id, env in self.environments_cache.items():
-            try:
-                resp = requests.post(f"{self.api_base}/environments/{env_id}/test", timeout=15)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    status = "Healthy" if data.get("is_healthy") else "Unhealthy"
-                    results.append(f"{env.get('name')}: {status}")
-                else:
-                    results.append(f"{env.get('name')}: HTTP {resp.status_code}")
-            except Exception as exc:
-                results.append(f"{env.get('name')}: Error {exc}")
-        QMessageBox.information(self, "Test Results", "\n".join(results))
+        self.test_all_btn.setEnabled(False)
+        worker = EnvTestWorker(self.api_base, dict(self.environments_cache), self.session)
+        worker.signals.tested.connect(self._on_environment_tested)
+        worker.signals.finished.connect(self._on_test_all_finished)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_environment_tested(self, result: tuple):
+        """Flip one environment's status as soon as its test returns"""
+        env_id, _, ok, _ = result
+        row = self.env_model.row_for_id(env_id)
+        if row >= 0:
+            self.env_model.update_status(row, "Healthy" if ok else "Unhealthy")
+    
+    def _on_test_all_finished(self, results: list):
+        """Summarise a finished test run"""
+        self.test_all_btn.setEnabled(True)
+        TestResultsDialog(self, [result[1:] for result in results]).exec()
+    
+    def _on_saved(self, success: str, failure: str, status_code, payload):
+        """Confirm a create/update/delete and reload, or show why the API refused it"""
+        if status_code == 200:
+            self._show_info(success)
+            self.refresh_data()
+        else:
+            QMessageBox.warning(self, "Error", f"{failure}: {payload}")
+    
+    def _show_info(self, text: str, title: str = "Success"):
+        """Show a success notification in the shared message box"""
+        self._info_box.setWindowTitle(title)
+        self._info_box.setText(text)
+        self._info_box.exec()
     
     def add_group(self):
         """Add new group"""
         dialog = GroupDialog(self)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            try:
-                resp = requests.post(
-                    f"{self.api_base}/environments/groups/",
+        with self._paused_refresh():
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self._submit(
+                    "POST", f"{self.api_base}/environments/groups/",
+                    partial(self._on_saved, "Group created", "Failed to create group"),
                     json=dialog.result_data,
-                    timeout=10,
                 )
-                if resp.status_code == 200:
-                    QMessageBox.information(self, "Success", "Group created")
-                    self.refresh_data()
-                else:
-                    QMessageBox.warning(self, "Error", f"Failed to create group: {resp.text}")
-            except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Request failed: {exc}")
     
     def edit_group(self):
         """Edit selected group"""
@@ -562,20 +923,13 @@ class EnvironmentsWindow(QWidget):
             return
         current_group = self.groups_cache.get(group_id, {})
         dialog = GroupDialog(self, group=current_group)
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            try:
-                resp = requests.put(
-                    f"{self.api_base}/environments/groups/{group_id}",
+        with self._paused_refresh():
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                self._submit(
+                    "PUT", f"{self.api_base}/environments/groups/{group_id}",
+                    partial(self._on_saved, "Group updated", "Failed to update group"),
                     json=dialog.result_data,
-                    timeout=10,
                 )
-                if resp.status_code == 200:
-                    QMessageBox.information(self, "Success", "Group updated")
-                    self.refresh_data()
-                else:
-                    QMessageBox.warning(self, "Error", f"Failed to update group: {resp.text}")
-            except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Request failed: {exc}")
     
     def delete_group(self):
         """Delete selected group"""
@@ -583,141 +937,198 @@ class EnvironmentsWindow(QWidget):
         if group_id is None:
             QMessageBox.warning(self, "Error", "Please select a group")
             return
-        reply = QMessageBox.question(
-            self,
-            "Confirm Delete",
-            "Delete this group?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-        )
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                resp = requests.delete(f"{self.api_base}/environments/groups/{group_id}", timeout=10)
-                if resp.status_code == 200:
-                    QMessageBox.information(self, "Success", "Group deleted")
-                    self.refresh_data()
-                else:
-                    QMessageBox.warning(self, "Error", f"Failed to delete group: {resp.text}")
-            except Exception as exc:
-                QMessageBox.critical(self, "Error", f"Request failed: {exc}")
+        with self._paused_refresh():
+            reply = QMessageBox.question(
+                self,
+                "Confirm Delete",
+                "Delete this group?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.Yes:
+                self._submit(
+                    "DELETE", f"{self.api_base}/environments/groups/{group_id}",
+                    partial(self._on_saved, "Group deleted", "Failed to delete group"),
+                )
     
     def bulk_backup(self):
         """Execute bulk backup"""
-        dialog = BulkBackupDialog(self)
-        dialog.exec()
+        dialog = BulkBackupDialog(self, environments=self.environments_cache, groups=self.groups_cache)
+        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.payload:
+            self._run_bulk_operation("backup", dialog.payload)
+    
+    def _run_bulk_operation(self, operation_type: str, payload: dict):
+        """Submit a bulk operation on the thread pool and track its progress in this tab"""
+        self.bulk_status_label.setText(f"Bulk {operation_type} running...")
+        self.bulk_progress.setValue(0)
+        worker = BulkOperationWorker(self.api_base, operation_type, payload, session=self.session)
+        self._bulk_workers.add(worker)
+        worker.signals.progress.connect(self.bulk_progress.setValue)
+        worker.signals.finished.connect(partial(self._on_bulk_operation_finished, worker))
+        worker.signals.error.connect(partial(self._on_bulk_operation_error, worker))
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_bulk_operation_finished(self, worker, op: dict):
+        """Show the final status of a tracked bulk operation"""
+        self._bulk_workers.discard(worker)
+        self.bulk_status_label.setText(f"{op.get('name', 'Bulk operation')}: {op.get('status', '')}")
+        self.refresh_data()
+    
+    def _on_bulk_operation_error(self, worker, exc: Exception):
+        """Report a failed bulk submission or status poll"""
+        self._bulk_workers.discard(worker)
+        self.bulk_status_label.setText(f"Bulk operation failed: {exc}")
     
     def bulk_restore(self):
         """Execute bulk restore"""
-        dialog = BulkRestoreDialog(self)
-        dialog.exec()
+        dialog = BulkRestoreDialog(self, environments=self.environments_cache, groups=self.groups_cache,
+                                   api_base=self.api_base)
+        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.payload:
+            self._run_bulk_operation("restore", dialog.payload)
     
     def bulk_compare(self):
         """Execute bulk compare"""
-        dialog = BulkCompareDialog(self)
-        dialog.exec()
+        dialog = BulkCompareDialog(self, environments=self.environments_cache)
+        if dialog.exec() == QDialog.DialogCode.Accepted and dialog.payload:
+            self._run_bulk_operation("compare", dialog.payload)
     
     def setup_refresh_timer(self):
-        """Setup auto-refresh timer"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.refresh_data)
-        self.timer.start(30000)  # Refresh every 30 seconds
+        """Setup auto-refresh timer, re-armed after each refresh so fetches never overlap"""
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_refresh_tick)
     
-    def refresh_data(self):
-        """Refresh environments list"""
-        try:
-            resp = requests.get(f"{self.api_base}/environments", timeout=10)
-            if resp.status_code != 200:
-                QMessageBox.warning(self, "Error", f"Failed to fetch environments: {resp.text}")
-                return
-            envs = resp.json()
-            self.environments_cache = {env["id"]: env for env in envs}
-            self.environments_table.setRowCount(0)
-            for env in envs:
-                self._add_environment_row(env)
-        except Exception as exc:
-            QMessageBox.critical(self, "Error", f"Request failed: {exc}")
-        
-        # Groups
-        try:
-            resp = requests.get(f"{self.api_base}/environments/groups/", timeout=10)
-            if resp.status_code == 200:
-                groups = resp.json()
-                self.groups_cache = {g["id"]: g for g in groups}
-                self.groups_table.setRowCount(0)
-                for g in groups:
-                    members = g.get("environment_ids") or []
-                    row = self.groups_table.rowCount()
-                    self.groups_table.insertRow(row)
-                    name_item = QTableWidgetItem(g.get("name", ""))
-                    name_item.setData(Qt.ItemDataRole.UserRole, g.get("id"))
-                    self.groups_table.setItem(row, 0, name_item)
-                    self.groups_table.setItem(row, 1, QTableWidgetItem(g.get("description") or ""))
-                    self.groups_table.setItem(row, 2, QTableWidgetItem(f"{len(members)} members"))
-            else:
-                QMessageBox.warning(self, "Error", f"Failed to fetch groups: {resp.text}")
-        except Exception as exc:
-            QMessageBox.critical(self, "Error", f"Request failed: {exc}")
+    def showEvent(self, event):
+        """Refresh as soon as the window has been painted"""
+        super().showEvent(event)
+        if not self.timer.isActive():
+            QTimer.singleShot(0, self.refresh_data)
+    
+    def hideEvent(self, event):
+        """Stop polling while nobody is looking"""
+        self.timer.stop()
+        super().hideEvent(event)
+    
+    def _submit(self, method: str, url: str, on_finished, json=None) -> bool:
+        """Run an API call on the thread pool; ``on_finished(status_code, payload)`` runs on the GUI thread
         
-        # Bulk operations history
+        Only GETs are de-duplicated: a repeated fetch would return the same
+        list, while every create/update/delete the user asks for must be sent.
+        """
+        key = (method, url)
+        if method == "GET":
+            if key in self._inflight:
+                return False
+            self._inflight.add(key)
+        headers = None
+        if method == "GET" and url in self._etags:
+            headers = {"If-None-Match": self._etags[url]}
+        worker = HttpWorker(self.session, method, url, json=json, headers=headers)
+        worker.signals.finished.connect(partial(self._on_request_finished, key, on_finished))
+        worker.signals.error.connect(partial(self._on_request_error, key))
+        QThreadPool.globalInstance().start(worker)
+        return True
+    
+    def _on_request_finished(self, key: tuple, on_finished, result: tuple):
+        self._inflight.discard(key)
+        status_code, payload, headers = result
+        method, url = key
+        if method == "GET" and status_code == 200 and headers.get("ETag"):
+            self._etags[url] = headers["ETag"]
+        if status_code != 304:
+            on_finished(status_code, payload)
+        self._rearm_refresh_timer()
+    
+    def _on_request_error(self, key: tuple, exc: Exception):
+        self._inflight.discard(key)
+        QMessageBox.critical(self, "Error", f"Request failed: {exc}")
+        self._rearm_refresh_timer()
+    
+    @contextmanager
+    def _paused_refresh(self):
+        """Hold off timed refreshes while a modal dialog waits on the user"""
+        self._refresh_pauses += 1
+        self.timer.stop()
         try:
-            resp = requests.get(f"{self.api_base}/environments/bulk/", timeout=10)
-            if resp.status_code == 200:
-                ops = resp.json()
-                self.operations_table.setRowCount(0)
-                for op in ops:
-                    row = self.operations_table.rowCount()
-                    self.operations_table.insertRow(row)
-                    self.operations_table.setItem(row, 0, QTableWidgetItem(op.get("name", "")))
-                    self.operations_table.setItem(row, 1, QTableWidgetItem(op.get("operation_type", "")))
-                    self.operations_table.setItem(row, 2, QTableWidgetItem(str(op.get("total_environments", 0))))
-                    status_item = QTableWidgetItem(op.get("status", ""))
-                    if op.get("status") in ("success", "completed", "in_progress", "pending"):
-                        status_item.setForeground(QColor(0, 176, 80))
-                    elif op.get("status") in ("failed", "error"):
-                        status_item.setForeground(QColor(200, 0, 0))
-                    self.operations_table.setItem(row, 3, status_item)
-                    self.operations_table.setItem(row, 4, QTableWidgetItem(self._format_last_tested(op.get("created_at"))))
-                    summary = op.get("results_summary") or {}
-                    self.operations_table.setItem(row, 5, QTableWidgetItem(str(summary)))
-            else:
-                QMessageBox.warning(self, "Error", f"Failed to fetch bulk operations: {resp.text}")
-        except Exception as exc:
-            QMessageBox.critical(self, "Error", f"Request failed: {exc}")
+            yield
+        finally:
+            self._refresh_pauses -= 1
+            self._rearm_refresh_timer()
+    
+    def _rearm_refresh_timer(self):
+        """Schedule the next refresh once no list fetch is outstanding and no dialog is open"""
+        if self.isVisible() and not self._inflight and not self._refresh_pauses:
+            self.timer.start(_REFRESH_INTERVAL_MS)
+    
+    def _on_refresh_tick(self):
+        """Timed refresh of the tab in view; nothing is fetched while minimized"""
+        if not self.isVisible():
+            return
+        if self.window().windowState() & Qt.WindowState.WindowMinimized:
+            self._rearm_refresh_timer()
+            return
+        if not self._tab_refreshers[self.tabs.currentIndex()]():
+            self._rearm_refresh_timer()
+    
+    def refresh_data(self):
+        """Refresh every tab that has been built; the fetches run in parallel"""
+        for index, refresh in self._tab_refreshers.items():
+            if index not in self._tab_builders:
+                refresh()
+    
+    def _refresh_envs(self) -> bool:
+        return self._submit("GET", f"{self.api_base}/environments", self._apply_environments)
+    
+    def _refresh_groups(self) -> bool:
+        return self._submit("GET", f"{self.api_base}/environments/groups/", self._apply_groups)
+    
+    def _refresh_bulk(self) -> bool:
+        # The bulk dialogs offer the groups as targets, so keep them current here too
+        groups = self._refresh_groups()
+        return self._submit("GET", f"{self.api_base}/environments/bulk/", self._apply_operations) or groups
+    
+    def _apply_environments(self, status_code, payload):
+        """Populate the environments table from a finished fetch"""
+        if status_code == 200:
+            self.environments_cache = {env["id"]: env for env in payload}
+            self.env_model.sync_rows([self._environment_row(env) for env in payload], [env["id"] for env in payload])
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to fetch environments: {payload}")
+    
+    def _apply_groups(self, status_code, payload):
+        """Populate the groups table from a finished fetch"""
+        if status_code == 200:
+            self.groups_cache = {g["id"]: g for g in payload}
+            self.groups_model.sync_rows([self._group_row(g) for g in payload], [g.get("id") for g in payload])
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to fetch groups: {payload}")
+    
+    def _apply_operations(self, status_code, payload):
+        """Populate the bulk operations history from a finished fetch"""
+        if status_code == 200:
+            self.operations_model.sync_rows([self._operation_row(op) for op in payload], [op.get("id") for op in payload])
+        else:
+            QMessageBox.warning(self, "Error", f"Failed to fetch bulk operations: {payload}")
     
     def _get_selected_env_id(self):
         """Return selected environment id or None"""
-        current_row = self.environments_table.currentRow()
-        if current_row < 0:
-            return None
-        item = self.environments_table.item(current_row, 0)
-        return item.data(Qt.ItemDataRole.UserRole) if item else None
+        index = self.environments_table.currentIndex()
+        return self.env_model.row_id(index.row()) if index.isValid() else None
     
     def _get_selected_group_id(self):
         """Return selected group id or None"""
-        current_row = self.groups_table.currentRow()
-        if current_row < 0:
-            return None
-        item = self.groups_table.item(current_row, 0)
-        return item.data(Qt.ItemDataRole.UserRole) if item else None
+        index = self.groups_table.currentIndex()
+        return self.groups_model.row_id(index.row()) if index.isValid() else None
 
     def _format_last_tested(self, last_tested):
         """Format timestamp from API"""
         if not last_tested:
             return "-"
-        try:
-            # FastAPI returns ISO string
-            dt = datetime.fromisoformat(last_tested.replace("Z", "+00:00"))
-            return dt.strftime("%Y-%m-%d %H:%M")
-        except Exception:
-            return str(last_tested)
-    
-    def _update_url_placeholder(self, deployment: str):
-        """Adjust URL placeholder depending on deployment type"""
-        if deployment.lower() == "saas":
-            self.url_input.setPlaceholderText("https://abc12345.live.dynatrace.com")
-        else:
-            self.url_input.setPlaceholderText("https://dynatrace.example.com/e/12345678")
+        return _fmt_iso(str(last_tested))
     
     def closeEvent(self, event):
         """Clean up on close"""
         self.timer.stop()
+        for worker in self._bulk_workers:
+            worker.cancel()
+        self.session.close()
         super().closeEvent(event)
@@ -1,15 +1,105 @@
 """Restore wizard window"""
+import os
+import threading
+import time
+import requests
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox,
     QTableWidget, QTableWidgetItem, QCheckBox, QGroupBox, QProgressBar,
     QMessageBox, QHeaderView
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QStringListModel, QThread, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QFont
 
+from ._common import font
+from ._workers import HttpWorker, default_session
+
+MZ_LIST: tuple[str, ...] = ("All Zones", "Zone 1", "Zone 2", "Zone 3")
+
+API_BASE_URL = os.getenv("API_BASE_URL", "http://127.0.0.1:8000/api")
+_POLL_INTERVAL = 0.5
+_PROGRESS_INTERVAL_MS = 33
+_RUNNING_STATUSES = frozenset({"pending", "in_progress"})
+
+class RestoreWorker(QObject):
+    """Start a restore through the API and poll it until it completes
+    
+    The restore is submitted as a single-target bulk restore so the API uses
+    the credentials stored with the target environment. Lives on its own
+    QThread; ``cancel`` is checked between polls. Progress is not signalled
+    but kept in ``counter`` for the window to sample.
+    """
+    status = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    finished = pyqtSignal()
+    
+    def __init__(self, api_base: str, payload: dict, session=None):
+        super().__init__()
+        self.api_base = api_base
+        self.payload = payload
+        self.session = session if session is not None else default_session()
+        self.cancel = False
+        self._lock = threading.Lock()
+        self._counter = 0
+    
+    @property
+    def counter(self) -> int:
+        with self._lock:
+            return self._counter
+    
+    def _advance(self, value: int):
+        with self._lock:
+            self._counter = value
+    
+    @pyqtSlot()
+    def run(self):
+        """Execute the restore and report its progress"""
+        try:
+            self._restore(self.session)
+        except requests.RequestException as e:
+            self.failed.emit(str(e))
+        except (ValueError, KeyError) as e:
+            # An unexpected body must not escape the slot, PyQt would abort the app
+            self.failed.emit(f"Unexpected response from the API: {e!r}")
+        finally:
+            self.finished.emit()
+    
+    def _restore(self, session):
+        resp = session.post(f"{self.api_base}/environments/bulk/restore", json=self.payload, timeout=10)
+        if resp.status_code != 200:
+            self.failed.emit(resp.text)
+            return
+        operation_id = resp.json()["bulk_operation_id"]
+        self._advance(10)
+        while not self.cancel:
+            time.sleep(_POLL_INTERVAL)
+            resp = session.get(f"{self.api_base}/environments/bulk/{operation_id}", timeout=10)
+            if self.cancel:
+                return
+            if resp.status_code != 200:
+                self.failed.emit(resp.text)
+                return
+            state = resp.json()
+            if state["status"] not in _RUNNING_STATUSES:
+                if state.get("failed_count"):
+                    self.failed.emit(f"Restore failed: {state.get('results_summary') or state['status']}")
+                self._advance(100)
+                self.status.emit(state["status"])
+                return
+            self._advance(min(self.counter + 5, 90))
+
 class RestoreWizardWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.api_base = API_BASE_URL
+        self._thread = None
+        self._worker = None
+        self._backup_ids: dict[str, int] = {}
+        self._environment_ids: dict[str, int] = {}
+        self._loaded = False
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(_PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._sample_progress)
         self.init_ui()
     
     def init_ui(self):
@@ -18,7 +108,7 @@ class RestoreWizardWindow(QWidget):
         
         # Title
         title = QLabel("Restore Configuration")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(font(14, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Backup selection
@@ -28,18 +118,16 @@ class RestoreWizardWindow(QWidget):
         select_layout = QHBoxLayout()
         select_layout.addWidget(QLabel("Backup:"))
         self.backup_combo = QComboBox()
-        self.backup_combo.addItems([
-            "backup_alerting_20260210_123456",
-            "backup_dashboards_20260209_102030",
-            "backup_all_20260208_150000"
-        ])
+        self._backup_model = QStringListModel()
+        self.backup_combo.setModel(self._backup_model)
+        self.backup_combo.setPlaceholderText("Loading backups...")
         select_layout.addWidget(self.backup_combo)
         select_layout.addWidget(QPushButton("📂 Browse"))
         backup_layout.addLayout(select_layout)
         
         # Backup details
         details_label = QLabel("Backup Details:")
-        details_label.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        details_label.setFont(font(10, QFont.Weight.Bold))
         backup_layout.addWidget(details_label)
         
         self.details_table = QTableWidget()
@@ -64,7 +152,7 @@ class RestoreWizardWindow(QWidget):
         env_layout = QHBoxLayout()
         env_layout.addWidget(QLabel("Environment:"))
         self.target_combo = QComboBox()
-        self.target_combo.addItems(["Production", "Staging", "Development"])
+        self.target_combo.setPlaceholderText("Loading environments...")
         env_layout.addWidget(self.target_combo)
         target_layout.addLayout(env_layout)
         
@@ -72,7 +160,10 @@ class RestoreWizardWindow(QWidget):
         mz_layout = QHBoxLayout()
         mz_layout.addWidget(QLabel("Restore to Management Zone:"))
         self.target_mz_combo = QComboBox()
-        self.target_mz_combo.addItems(["All Zones", "Zone 1", "Zone 2", "Zone 3"])
+        self.target_mz_combo.addItems(MZ_LIST)
+        # Restores use the environment's stored settings, which have no zone filter
+        self.target_mz_combo.setEnabled(False)
+        self.target_mz_combo.setToolTip("Not supported when restoring to a stored environment")
         mz_layout.addWidget(self.target_mz_combo)
         target_layout.addLayout(mz_layout)
         
@@ -88,6 +179,9 @@ class RestoreWizardWindow(QWidget):
         
         self.overwrite_check = QCheckBox("Overwrite existing configurations")
         self.overwrite_check.setChecked(True)
+        # Monaco deploys always overwrite; the API has no option to do otherwise
+        self.overwrite_check.setEnabled(False)
+        self.overwrite_check.setToolTip("Restores always overwrite existing configurations")
         options_layout.addWidget(self.overwrite_check)
         
         options_group.setLayout(options_layout)
@@ -124,9 +218,59 @@ class RestoreWizardWindow(QWidget):
         
         self.setLayout(layout)
     
+    def showEvent(self, event):
+        """Load the restore targets from the API the first time the window is shown"""
+        super().showEvent(event)
+        if not self._loaded:
+            self._loaded = True
+            self._fetch("environments", self._on_environments_loaded)
+            self._fetch("backups/list", self._on_backups_loaded)
+    
+    def _fetch(self, path: str, on_loaded):
+        """GET an API list on the thread pool and hand the rows to on_loaded"""
+        worker = HttpWorker(default_session(), "GET", f"{self.api_base}/{path}")
+        worker.signals.finished.connect(lambda result: self._on_fetched(path, result, on_loaded))
+        worker.signals.error.connect(lambda exc: self._on_fetch_error(path, exc))
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_fetched(self, path: str, result: tuple, on_loaded):
+        """Pass a successful list response on, report anything else"""
+        status_code, payload, _ = result
+        if status_code != 200 or not isinstance(payload, list):
+            self._on_fetch_error(path, f"HTTP {status_code}")
+            return
+        on_loaded(payload)
+    
+    def _on_fetch_error(self, path: str, error):
+        """Show why a list could not be loaded"""
+        self.progress_label.setText(f"Could not load {path.split('/')[0]}: {error}")
+    
+    def _on_environments_loaded(self, environments: list):
+        """Offer the API's environments as restore targets"""
+        self.set_environments({env["name"]: env["id"] for env in environments})
+    
+    def _on_backups_loaded(self, backups: list):
+        """Offer the completed backups from the API"""
+        self.set_backups({b["name"]: b["id"] for b in backups if b.get("status") == "success"})
+    
+    def set_environments(self, environments: dict[str, int]):
+        """Replace the selectable target environments, given as name -> API environment id"""
+        self._environment_ids = dict(environments)
+        self.target_combo.clear()
+        self.target_combo.addItems(list(environments))
+        if environments:
+            self.target_combo.setCurrentIndex(0)
+    
+    def set_backups(self, backups: dict[str, int]):
+        """Replace the selectable backups, given as name -> API backup id"""
+        self._backup_ids = dict(backups)
+        self._backup_model.setStringList(list(backups))
+        if backups:
+            self.backup_combo.setCurrentIndex(0)
+    
     def validate_config(self):
         """Validate restore configuration"""
-        if self.backup_combo.currentText() == "Select a backup":
+        if self.backup_combo.currentText() not in self._backup_ids:
             QMessageBox.warning(self, "Validation Error", "Please select a backup")
             return
         
@@ -134,6 +278,16 @@ class RestoreWizardWindow(QWidget):
     
     def start_restore(self):
         """Start the restore"""
+        backup_id = self._backup_ids.get(self.backup_combo.currentText())
+        if backup_id is None:
+            QMessageBox.warning(self, "Restore Error", "The selected backup is not known to the API")
+            return
+        environment = self.target_combo.currentText()
+        environment_id = self._environment_ids.get(environment)
+        if environment_id is None:
+            QMessageBox.warning(self, "Restore Error", "Please select a target environment")
+            return
+        
         if self.dry_run_check.isChecked():
             reply = QMessageBox.question(
                 self,
@@ -153,11 +307,67 @@ class RestoreWizardWindow(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
         
+        payload = {
+            "name": f"Restore {self.backup_combo.currentText()} to {environment}",
+            "backup_ids": [backup_id],
+            "target_environment_ids": [environment_id],
+            "dry_run": self.dry_run_check.isChecked(),
+        }
+        
         self.progress_label.setText("Starting restore...")
         self.progress_bar.setValue(0)
-        # TODO: Connect to API
+        self.restore_btn.setEnabled(False)
+        
+        self._thread = QThread(self)
+        self._worker = RestoreWorker(self.api_base, payload)
+        self._worker.moveToThread(self._thread)
+        self._worker.status.connect(self._on_restore_status)
+        self._worker.failed.connect(self._on_restore_failed)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._on_thread_finished)
+        self._thread.started.connect(self._worker.run)
+        self._thread.start()
+        self._progress_timer.start()
+    
+    def _sample_progress(self):
+        """Copy the worker's progress to the bar, at most once per timer tick"""
+        value = self._worker.counter
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
+    
+    def _on_restore_status(self, status: str):
+        """Show the final status of the restore"""
+        self.progress_label.setText(f"Restore {status}")
+    
+    def _on_restore_failed(self, message: str):
+        """Report a failed restore"""
+        self.progress_label.setText("Restore failed")
+        QMessageBox.critical(self, "Restore Error", message)
+    
+    def _on_thread_finished(self):
+        """Release the worker thread once it has stopped"""
+        if self._progress_timer.isActive():
+            self._progress_timer.stop()
+            self._sample_progress()
+        self._thread.deleteLater()
+        self._thread = None
+        self._worker = None
+        self.restore_btn.setEnabled(True)
     
     def cancel_restore(self):
         """Cancel the restore"""
+        if self._worker is not None:
+            self._worker.cancel = True
+            self._thread.quit()
+        self._progress_timer.stop()
         self.progress_label.setText("Cancelled")
         self.progress_bar.setValue(0)
+    
+    def closeEvent(self, event):
+        """Stop a running restore before the window goes away"""
+        if self._thread is not None:
+            self._worker.cancel = True
+            self._thread.quit()
+            self._thread.wait()
+        super().closeEvent(event)
@@ -1,12 +1,168 @@
 """Schedules management window"""
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget,
-    QTableWidgetItem, QDialog, QLineEdit, QCheckBox, QMessageBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView,
+    QDialog, QLineEdit, QCheckBox, QMessageBox,
     QHeaderView, QGroupBox, QComboBox, QSpinBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QStringListModel
 from PyQt6.QtGui import QFont, QColor
 
+from ._common import font
+
+@dataclass(slots=True)
+class Schedule:
+    name: str
+    type_: str
+    freq: str
+    time: str
+    enabled: bool
+    last_run: str
+    next_run: str
+
+FREQUENCIES: tuple[str, ...] = ("Daily", "Weekly", "Monthly", "Custom Cron")
+CONFIG_TYPES: tuple[str, ...] = (
+    "All Configurations",
+    "Alerting Profiles",
+    "Dashboards",
+    "SLO",
+    "Rules",
+    "Maintenance Windows",
+    "Notification Channels",
+    "Management Zones",
+    "Anomaly Detection",
+    "Auto Tags",
+    "Application Detection Rules",
+    "Service Detection",
+    "Request Attributes",
+    "Metric Events",
+    "Synthetic Monitors",
+    "Extensions",
+)
+
+# Preset widths (px) for columns 1-6; sizing to contents would measure every row
+_COLUMN_WIDTHS = {1: 100, 2: 80, 3: 60, 4: 70, 5: 120, 6: 130}
+_ROW_HEIGHT = 22
+
+# Enabled/disabled indicator colors, shared by every row
+_GREEN = QColor(0, 176, 80)
+_RED = QColor(255, 0, 0)
+
+_SAMPLE_SCHEDULES = [
+    ("Daily Alerting Backup", "Alerting", "Daily", "02:00", True, "Today 02:15", "Tomorrow 02:00"),
+    ("Weekly Full Backup", "All Configs", "Weekly", "03:00", True, "Sun 03:30", "Next Sun 03:00"),
+    ("Dashboard Backup", "Dashboards", "Daily", "12:00", False, "N/A", "N/A"),
+]
+
+@lru_cache(maxsize=None)
+def _get_cfg_model() -> QStringListModel:
+    """Config type choices, built once and shared by every ScheduleDialog"""
+    return QStringListModel(list(CONFIG_TYPES))
+
+@lru_cache(maxsize=512)
+def _next_run(freq: str, at: str, epoch_minute: int) -> str | None:
+    """Next run of a Daily/Weekly (Sunday)/Monthly (1st) schedule at HH:MM, as seen at the given minute"""
+    try:
+        hour, minute = map(int, at.split(":"))
+    except ValueError:
+        return None
+    now = datetime.fromtimestamp(epoch_minute * 60)
+    run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if freq == "Daily":
+        if run <= now:
+            run += timedelta(days=1)
+    elif freq == "Weekly":
+        run += timedelta(days=(6 - run.weekday()) % 7)
+        if run <= now:
+            run += timedelta(days=7)
+    elif freq == "Monthly":
+        run = run.replace(day=1)
+        if run <= now:
+            run = run.replace(year=run.year + run.month // 12, month=run.month % 12 + 1)
+    else:
+        return None
+    return run.strftime("%Y-%m-%d %H:%M")
+
+class ScheduleModel(QAbstractTableModel):
+    """Table model over a plain list of schedules"""
+    HEADERS = ("Name", "Type", "Frequency", "Time", "Enabled", "Last Run", "Next Run")
+    ENABLED_COLUMN = 4
+    NEXT_RUN_COLUMN = 6
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[Schedule] = []
+        # Display text per row, rebuilt only when that row changes
+        self._display: list[tuple] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.NEXT_RUN_COLUMN:
+                schedule = self._rows[index.row()]
+                if schedule.enabled:
+                    # Paints query this repeatedly; the cache makes it a lookup within the same minute
+                    return _next_run(schedule.freq, schedule.time, int(time.time()) // 60) or schedule.next_run
+            return self._display[index.row()][column]
+        if column != self.ENABLED_COLUMN:
+            return None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return _GREEN if self._rows[index.row()].enabled else _RED
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+    
+    def append(self, schedule: Schedule):
+        """Append one schedule"""
+        self.extend([schedule])
+    
+    def extend(self, schedules: list[Schedule]):
+        """Append schedules with a single insert notification"""
+        if not schedules:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(schedules) - 1)
+        self._rows.extend(schedules)
+        self._display.extend(self._display_row(schedule) for schedule in schedules)
+        self.endInsertRows()
+    
+    def remove_row(self, row: int):
+        """Remove one schedule"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._display[row]
+        self.endRemoveRows()
+    
+    def toggle(self, row: int):
+        """Flip a schedule's enabled flag"""
+        schedule = self._rows[row]
+        schedule.enabled = not schedule.enabled
+        self._display[row] = self._display_row(schedule)
+        # Next Run depends on the flag as well
+        self.dataChanged.emit(
+            self.index(row, self.ENABLED_COLUMN), self.index(row, self.NEXT_RUN_COLUMN),
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole]
+        )
+    
+    @staticmethod
+    def _display_row(schedule: Schedule) -> tuple:
+        return (schedule.name, schedule.type_, schedule.freq, schedule.time,
+                "✓" if schedule.enabled else "✕", schedule.last_run, schedule.next_run)
+
 class ScheduleDialog(QDialog):
     def __init__(self, parent=None, schedule=None):
         super().__init__(parent)
@@ -19,7 +175,7 @@ class ScheduleDialog(QDialog):
         
         title_text = "Edit Schedule" if self.schedule else "New Schedule"
         title = QLabel(title_text)
-        title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        title.setFont(font(12, QFont.Weight.Bold))
         layout.addWidget(title)
         
         # Name
@@ -31,7 +187,7 @@ class ScheduleDialog(QDialog):
         freq_layout = QHBoxLayout()
         freq_layout.addWidget(QLabel("Frequency:"))
         self.freq_combo = QComboBox()
-        self.freq_combo.addItems(["Daily", "Weekly", "Monthly", "Custom Cron"])
+        self.freq_combo.addItems(FREQUENCIES)
         freq_layout.addWidget(self.freq_combo)
         layout.addLayout(freq_layout)
         
@@ -54,24 +210,7 @@ class ScheduleDialog(QDialog):
         # Backup type
         layout.addWidget(QLabel("Config Type:"))
         self.type_combo = QComboBox()
-        self.type_combo.addItems([
-            "All Configurations",
-            "Alerting Profiles",
-            "Dashboards",
-            "SLO",
-            "Rules",
-            "Maintenance Windows",
-            "Notification Channels",
-            "Management Zones",
-            "Anomaly Detection",
-            "Auto Tags",
-            "Application Detection Rules",
-            "Service Detection",
-            "Request Attributes",
-            "Metric Events",
-            "Synthetic Monitors",
-            "Extensions"
-        ])
+        self.type_combo.setModel(_get_cfg_model())
         layout.addWidget(self.type_combo)
         
         # Enabled
@@ -96,9 +235,21 @@ class ScheduleDialog(QDialog):
         self.setLayout(layout)
         self.setGeometry(100, 100, 400, 350)
 
+def _require_selection(method):
+    """Warn instead of calling ``method`` when no schedule is selected; pass it the selected row"""
+    @wraps(method)
+    def wrapper(self):
+        current_row = self.schedules_table.currentIndex().row()
+        if current_row < 0:
+            QMessageBox.warning(self, "Error", "Please select a schedule")
+            return
+        return method(self, current_row)
+    return wrapper
+
 class SchedulesWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.model = ScheduleModel(self)
         self.init_ui()
     
     def init_ui(self):
@@ -108,7 +259,7 @@ class SchedulesWindow(QWidget):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Backup Schedules")
-        title.setFont(QFont("Segoe UI", 14, QFont.Weight.Bold))
+        title.setFont(font(14, QFont.Weight.Bold))
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -117,25 +268,21 @@ class SchedulesWindow(QWidget):
         table_group = QGroupBox("Scheduled Backups")
         table_layout = QVBoxLayout()
         
-        self.schedules_table = QTableWidget()
-        self.schedules_table.setColumnCount(7)
-        self.schedules_table.setHorizontalHeaderLabels([
-            "Name", "Type", "Frequency", "Time", "Enabled", "Last Run", "Next Run"
-        ])
+        self.schedules_table = QTableView()
+        self.schedules_table.setModel(self.model)
         
         header = self.schedules_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        for column, width in _COLUMN_WIDTHS.items():
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
+        
+        vertical = self.schedules_table.verticalHeader()
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(_ROW_HEIGHT)
         
         # Add sample data
-        self._add_schedule_row("Daily Alerting Backup", "Alerting", "Daily", "02:00", True, "Today 02:15", "Tomorrow 02:00")
-        self._add_schedule_row("Weekly Full Backup", "All Configs", "Weekly", "03:00", True, "Sun 03:30", "Next Sun 03:00")
-        self._add_schedule_row("Dashboard Backup", "Dashboards", "Daily", "12:00", False, "N/A", "N/A")
+        self.model.extend([Schedule(*row) for row in _SAMPLE_SCHEDULES])
         
         table_layout.addWidget(self.schedules_table)
         table_group.setLayout(table_layout)
@@ -165,50 +312,22 @@ class SchedulesWindow(QWidget):
         
         self.setLayout(layout)
     
-    def _add_schedule_row(self, name: str, type_: str, freq: str, time: str, enabled: bool, last_run: str, next_run: str):
-        """Add a row to the schedules table"""
-        row = self.schedules_table.rowCount()
-        self.schedules_table.insertRow(row)
-        
-        self.schedules_table.setItem(row, 0, QTableWidgetItem(name))
-        self.schedules_table.setItem(row, 1, QTableWidgetItem(type_))
-        self.schedules_table.setItem(row, 2, QTableWidgetItem(freq))
-        self.schedules_table.setItem(row, 3, QTableWidgetItem(time))
-        
-        status_item = QTableWidgetItem("✓" if enabled else "✕")
-        if enabled:
-            status_item.setForeground(QColor(0, 176, 80))
-        else:
-            status_item.setForeground(QColor(255, 0, 0))
-        self.schedules_table.setItem(row, 4, status_item)
-        
-        self.schedules_table.setItem(row, 5, QTableWidgetItem(last_run))
-        self.schedules_table.setItem(row, 6, QTableWidgetItem(next_run))
-    
     def add_schedule(self):
         """Add new schedule"""
         dialog = ScheduleDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             QMessageBox.information(self, "Success", "Schedule created successfully")
     
-    def edit_schedule(self):
+    @_require_selection
+    def edit_schedule(self, current_row: int):
         """Edit selected schedule"""
-        current_row = self.schedules_table.currentRow()
-        if current_row < 0:
-            QMessageBox.warning(self, "Error", "Please select a schedule")
-            return
-        
         dialog = ScheduleDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             QMessageBox.information(self, "Success", "Schedule updated successfully")
     
-    def delete_schedule(self):
+    @_require_selection
+    def delete_schedule(self, current_row: int):
         """Delete selected schedule"""
-        current_row = self.schedules_table.currentRow()
-        if current_row < 0:
-            QMessageBox.warning(self, "Error", "Please select a schedule")
-            return
-        
         reply = QMessageBox.question(
             self,
             "Confirm Delete",
@@ -217,16 +336,10 @@ class SchedulesWindow(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.schedules_table.removeRow(current_row)
+            self.model.remove_row(current_row)
             QMessageBox.information(self, "Success", "Schedule deleted")
     
-    def toggle_schedule(self):
+    @_require_selection
+    def toggle_schedule(self, current_row: int):
         """Toggle schedule enabled/disabled"""
-        current_row = self.schedules_table.currentRow()
-        if current_row < 0:
-            QMessageBox.warning(self, "Error", "Please select a schedule")
-            return
-        
-        current_status = self.schedules_table.item(current_row, 4).text()
-        new_status = "✕" if current_status == "✓" else "✓"
-        self.schedules_table.item(current_row, 4).setText(new_status)
+        self.model.toggle(current_row)
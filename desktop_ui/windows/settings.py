@@ -6,11 +6,50 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtGui import QFont
 
+THEMES: tuple[str, ...] = ("Light", "Dark", "Auto")
+LANGUAGES: tuple[str, ...] = ("English", "Français", "Deutsch")
+
+# Tab specs: (group title, ((key, kind, label, arg), ...)) per group box.
+# "check" takes the initial state, "combo" its items, "line"/"path" the
+# initial text and "spin" (minimum, maximum, value, suffix).
+_GENERAL_SPEC = (
+    ("Application", (
+        ("theme", "combo", "Theme:", THEMES),
+        ("language", "combo", "Language:", LANGUAGES),
+        ("auto_refresh", "check", "Auto-refresh dashboard (every 30 seconds)", True),
+        ("startup", "check", "Start with system", False),
+    )),
+)
+_BACKUP_SPEC = (
+    ("Backup Storage", (
+        ("backup_dir", "path", "Backup Directory:", "D:\\backups\\dynatrace"),
+    )),
+    ("Retention Policy", (
+        ("retention_days", "spin", "Keep backups for:", (1, 365, 30, "days")),
+        ("auto_delete", "check", "Automatically delete old backups", True),
+    )),
+    ("Compression", (
+        ("compress", "check", "Compress backups automatically", True),
+        ("encrypt", "check", "Encrypt sensitive data", False),
+    )),
+)
+_ADVANCED_SPEC = (
+    ("API Configuration", (
+        ("api_host", "line", "API Host:", "127.0.0.1"),
+        ("api_port", "spin", "API Port:", (1024, 65535, 8000, None)),
+    )),
+    ("Logging", (
+        ("debug", "check", "Enable debug logging", False),
+    )),
+)
+
 class SettingsWindow(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setGeometry(100, 100, 500, 600)
+        self._widgets: dict[str, QWidget] = {}
+        self.values: dict = {}
         self.init_ui()
     
     def init_ui(self):
@@ -18,21 +57,19 @@ class SettingsWindow(QDialog):
         layout = QVBoxLayout()
         
         # Tab widget
-        tabs = QTabWidget()
+        self.tabs = QTabWidget()
         
         # General settings
-        general_tab = self._create_general_tab()
-        tabs.addTab(general_tab, "General")
-        
-        # Backup settings
-        backup_tab = self._create_backup_tab()
-        tabs.addTab(backup_tab, "Backup")
+        general_tab = self._build_tab(_GENERAL_SPEC)
+        self.tabs.addTab(general_tab, "General")
         
-        # Advanced settings
-        advanced_tab = self._create_advanced_tab()
-        tabs.addTab(advanced_tab, "Advanced")
+        # Backup and Advanced settings are built on first activation
+        self.tabs.addTab(QWidget(), "Backup")
+        self.tabs.addTab(QWidget(), "Advanced")
+        self._tab_specs = {1: _BACKUP_SPEC, 2: _ADVANCED_SPEC}
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
-        layout.addWidget(tabs)
+        layout.addWidget(self.tabs)
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -50,153 +87,105 @@ class SettingsWindow(QDialog):
         
         self.setLayout(layout)
     
-    def _create_general_tab(self) -> QWidget:
-        """Create general settings tab"""
-        widget = QWidget()
-        layout = QVBoxLayout()
-        
-        group = QGroupBox("Application")
-        group_layout = QVBoxLayout()
-        
-        # Theme
-        group_layout.addWidget(QLabel("Theme:"))
-        theme_combo = self._create_combo(["Light", "Dark", "Auto"])
-        group_layout.addWidget(theme_combo)
-        
-        # Language
-        group_layout.addWidget(QLabel("Language:"))
-        lang_combo = self._create_combo(["English", "Français", "Deutsch"])
-        group_layout.addWidget(lang_combo)
-        
-        # Auto-refresh
-        auto_refresh = QCheckBox("Auto-refresh dashboard (every 30 seconds)")
-        auto_refresh.setChecked(True)
-        group_layout.addWidget(auto_refresh)
-        
-        # Startup
-        startup = QCheckBox("Start with system")
-        group_layout.addWidget(startup)
-        
-        group.setLayout(group_layout)
-        layout.addWidget(group)
-        
-        layout.addStretch()
-        widget.setLayout(layout)
-        return widget
+    def _on_tab_changed(self, index: int):
+        """Replace a placeholder tab with its real content the first time it is shown"""
+        spec = self._tab_specs.pop(index, None)
+        if spec is None:
+            return
+        placeholder = self.tabs.widget(index)
+        label = self.tabs.tabText(index)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, self._build_tab(spec), label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
     
-    def _create_backup_tab(self) -> QWidget:
-        """Create backup settings tab"""
+    def _build_tab(self, spec: tuple) -> QWidget:
+        """Create a settings tab from its spec, registering each input in self._widgets"""
         widget = QWidget()
         layout = QVBoxLayout()
         
-        # Backup location
-        group1 = QGroupBox("Backup Storage")
-        group1_layout = QVBoxLayout()
-        
-        group1_layout.addWidget(QLabel("Backup Directory:"))
-        path_layout = QHBoxLayout()
-        path_input = QLineEdit()
-        path_input.setText("D:\\backups\\dynatrace")
-        path_layout.addWidget(path_input)
-        browse_btn = QPushButton("Browse...")
-        browse_btn.clicked.connect(lambda: QFileDialog.getExistingDirectory(self))
-        path_layout.addWidget(browse_btn)
-        group1_layout.addLayout(path_layout)
-        
-        group1.setLayout(group1_layout)
-        layout.addWidget(group1)
-        
-        # Retention
-        group2 = QGroupBox("Retention Policy")
-        group2_layout = QVBoxLayout()
-        
-        retention_layout = QHBoxLayout()
-        retention_layout.addWidget(QLabel("Keep backups for:"))
-        retention_spin = QSpinBox()
-        retention_spin.setMinimum(1)
-        retention_spin.setMaximum(365)
-        retention_spin.setValue(30)
-        retention_layout.addWidget(retention_spin)
-        retention_layout.addWidget(QLabel("days"))
-        retention_layout.addStretch()
-        group2_layout.addLayout(retention_layout)
-        
-        auto_delete = QCheckBox("Automatically delete old backups")
-        auto_delete.setChecked(True)
-        group2_layout.addWidget(auto_delete)
-        
-        group2.setLayout(group2_layout)
-        layout.addWidget(group2)
-        
-        # Compression
-        group3 = QGroupBox("Compression")
-        group3_layout = QVBoxLayout()
-        
-        compress = QCheckBox("Compress backups automatically")
-        compress.setChecked(True)
-        group3_layout.addWidget(compress)
-        
-        encrypt = QCheckBox("Encrypt sensitive data")
-        group3_layout.addWidget(encrypt)
-        
-        group3.setLayout(group3_layout)
-        layout.addWidget(group3)
+        for title, fields in spec:
+            group = QGroupBox(title)
+            group_layout = QVBoxLayout()
+            for key, kind, label, arg in fields:
+                self._widgets[key] = self._build_field(group_layout, kind, label, arg)
+            group.setLayout(group_layout)
+            layout.addWidget(group)
         
         layout.addStretch()
         widget.setLayout(layout)
         return widget
     
-    def _create_advanced_tab(self) -> QWidget:
-        """Create advanced settings tab"""
-        widget = QWidget()
-        layout = QVBoxLayout()
-        
-        # API settings
-        group1 = QGroupBox("API Configuration")
-        group1_layout = QVBoxLayout()
-        
-        host_layout = QHBoxLayout()
-        host_layout.addWidget(QLabel("API Host:"))
-        host_input = QLineEdit()
-        host_input.setText("127.0.0.1")
-        host_layout.addWidget(host_input)
-        group1_layout.addLayout(host_layout)
-        
-        port_layout = QHBoxLayout()
-        port_layout.addWidget(QLabel("API Port:"))
-        port_spin = QSpinBox()
-        port_spin.setMinimum(1024)
-        port_spin.setMaximum(65535)
-        port_spin.setValue(8000)
-        port_layout.addWidget(port_spin)
-        port_layout.addStretch()
-        group1_layout.addLayout(port_layout)
-        
-        group1.setLayout(group1_layout)
-        layout.addWidget(group1)
-        
-        # Logging
-        group2 = QGroupBox("Logging")
-        group2_layout = QVBoxLayout()
-        
-        debug = QCheckBox("Enable debug logging")
-        group2_layout.addWidget(debug)
-        
-        group2.setLayout(group2_layout)
-        layout.addWidget(group2)
-        
-        layout.addStretch()
-        widget.setLayout(layout)
-        return widget
+    def _build_field(self, group_layout: QVBoxLayout, kind: str, label: str, arg) -> QWidget:
+        """Add one spec field to a group and return its input widget"""
+        if kind == "check":
+            field = QCheckBox(label)
+            field.setChecked(arg)
+            group_layout.addWidget(field)
+            return field
+        
+        if kind == "combo":
+            group_layout.addWidget(QLabel(label))
+            field = self._create_combo(arg)
+            group_layout.addWidget(field)
+            return field
+        
+        if kind == "path":
+            group_layout.addWidget(QLabel(label))
+            path_layout = QHBoxLayout()
+            field = QLineEdit()
+            field.setText(arg)
+            path_layout.addWidget(field)
+            browse_btn = QPushButton("Browse...")
+            browse_btn.clicked.connect(lambda: QFileDialog.getExistingDirectory(self))
+            path_layout.addWidget(browse_btn)
+            group_layout.addLayout(path_layout)
+            return field
+        
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(QLabel(label))
+        if kind == "line":
+            field = QLineEdit()
+            field.setText(arg)
+            row_layout.addWidget(field)
+        else:
+            minimum, maximum, value, suffix = arg
+            field = QSpinBox()
+            field.setMinimum(minimum)
+            field.setMaximum(maximum)
+            field.setValue(value)
+            row_layout.addWidget(field)
+            if suffix:
+                row_layout.addWidget(QLabel(suffix))
+            row_layout.addStretch()
+        group_layout.addLayout(row_layout)
+        return field
     
-    def _create_combo(self, items: list):
+    def _create_combo(self, items: tuple):
         """Create a combo box with items"""
         from PyQt6.QtWidgets import QComboBox
         combo = QComboBox()
         combo.addItems(items)
         return combo
     
+    def settings(self) -> dict:
+        """Current value of every built settings field, keyed by name"""
+        values = {}
+        for key, field in self._widgets.items():
+            if isinstance(field, QCheckBox):
+                values[key] = field.isChecked()
+            elif isinstance(field, QSpinBox):
+                values[key] = field.value()
+            elif isinstance(field, QLineEdit):
+                values[key] = field.text()
+            else:
+                values[key] = field.currentText()
+        return values
+    
     def save_settings(self):
         """Save settings"""
+        self.values = self.settings()
         QMessageBox.information(self, "Success", "Settings saved successfully")
         self.accept()
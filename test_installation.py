@@ -1,10 +1,21 @@
 """Simple test to verify installation and configuration"""
 import sys
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# The checks run concurrently; each prints its section as one block under this lock
+_print_lock = threading.Lock()
+
+def _report(lines):
+    """Print one check's output without interleaving it with the others"""
+    with _print_lock:
+        print("\n".join(lines))
+
 def test_imports():
-    """Test if all required packages can be imported"""
-    print("Testing imports...")
+    """Test if all required packages can be imported (resolved, not executed)"""
+    lines = ["Testing imports..."]
     
     packages = [
         ("fastapi", "FastAPI"),
@@ -18,18 +29,18 @@ def test_imports():
     
     errors = []
     for package, name in packages:
-        try:
-            __import__(package)
-            print(f"  ✓ {name}")
-        except ImportError:
-            print(f"  ✗ {name} - NOT INSTALLED")
+        if importlib.util.find_spec(package) is not None:
+            lines.append(f"  ✓ {name}")
+        else:
+            lines.append(f"  ✗ {name} - NOT INSTALLED")
             errors.append(name)
     
+    _report(lines)
     return len(errors) == 0
 
 def test_project_structure():
     """Test if project structure is correct"""
-    print("\nTesting project structure...")
+    lines = ["\nTesting project structure..."]
     
     required_dirs = [
         "backend/app/api",
@@ -45,16 +56,17 @@ def test_project_structure():
     for dir_path in required_dirs:
         full_path = Path(dir_path)
         if full_path.exists():
-            print(f"  ✓ {dir_path}")
+            lines.append(f"  ✓ {dir_path}")
         else:
-            print(f"  ✗ {dir_path} - MISSING")
+            lines.append(f"  ✗ {dir_path} - MISSING")
             errors.append(dir_path)
     
+    _report(lines)
     return len(errors) == 0
 
 def test_configuration():
     """Test configuration files"""
-    print("\nTesting configuration...")
+    lines = ["\nTesting configuration..."]
     
     config_files = [
         ".env.example",
@@ -64,24 +76,24 @@ def test_configuration():
     errors = []
     for file_path in config_files:
         if Path(file_path).exists():
-            print(f"  ✓ {file_path}")
+            lines.append(f"  ✓ {file_path}")
         else:
-            print(f"  ✗ {file_path} - MISSING")
+            lines.append(f"  ✗ {file_path} - MISSING")
             errors.append(file_path)
     
     # Check .env exists or create it
     if not Path(".env").exists():
-        print("  ! .env not found, creating from .env.example...")
+        lines.append("  ! .env not found, creating from .env.example...")
         try:
-            import shutil
-            shutil.copy(".env.example", ".env")
-            print("  ✓ .env created")
-        except:
-            print("  ✗ Failed to create .env")
+            Path(".env").write_bytes(Path(".env.example").read_bytes())
+            lines.append("  ✓ .env created")
+        except OSError as e:
+            lines.append(f"  ✗ Failed to create .env - {e}")
             errors.append(".env")
     else:
-        print("  ✓ .env")
+        lines.append("  ✓ .env")
     
+    _report(lines)
     return len(errors) == 0
 
 def main():
@@ -91,11 +103,14 @@ def main():
     print("=" * 50)
     print()
     
-    results = {
-        "Imports": test_imports(),
-        "Project Structure": test_project_structure(),
-        "Configuration": test_configuration(),
-    }
+    checks = [
+        ("Imports", test_imports),
+        ("Project Structure", test_project_structure),
+        ("Configuration", test_configuration),
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+        futures = {name: ex.submit(check) for name, check in checks}
+        results = {name: future.result() for name, future in futures.items()}
     
     print("\n" + "=" * 50)
     print("Test Results:")
@@ -1,178 +1,386 @@
 """Multi-Tenant Setup Validation Script"""
-import subprocess
+import argparse
+import os
+import sqlite3
 import json
+import re
 import time
 import sys
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext, redirect_stdout
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import requests
+
+# The API server runs from backend/ (see start-api.bat): its .env and any
+# relative DATABASE_URL are resolved against that directory
+_BACKEND_DIR = Path(__file__).resolve().parent / "backend"
+
+@lru_cache(maxsize=None)
+def _load_backend_settings():
+    """Import the backend settings as the API server sees them, once, on first use; (settings, error)"""
+    sys.path.insert(0, str(_BACKEND_DIR))
+    cwd = os.getcwd()
+    os.chdir(_BACKEND_DIR)
+    try:
+        from app.core.config import settings
+        return settings, None
+    except (ImportError, ValueError) as e:
+        # pydantic's ValidationError is a ValueError
+        return None, e
+    finally:
+        os.chdir(cwd)
+
+# Status codes showing an endpoint is routed; 404/401 still mean the server answered
+_ENV_OK_CODES = frozenset({200, 301, 302, 307, 308, 404, 401})
+_BULK_OK_CODES = frozenset({200, 404, 401})
+
+REQUIRED_ENV_KEYS: tuple[str, ...] = ("DYNATRACE_ENVIRONMENT_URL", "DYNATRACE_API_TOKEN")
+# KEY=value assignments, optionally indented or written as shell exports
+_ENV_KEYS_RE = re.compile(
+    r"^[ \t]*(?:export[ \t]+)?(" + "|".join(map(re.escape, REQUIRED_ENV_KEYS)) + r")[ \t]*=", re.M
+)
+
+# Last successful schema check, keyed by database path and PRAGMA schema_version
+_SCHEMA_CACHE = Path.home() / ".cache" / "multitenant_validator_schema.json"
+
+# Diagnostic lines of the check running on the current worker thread
+_check_output = threading.local()
+
+def _say(line: str):
+    """Print a line, or hold it back until the check running on this thread has finished"""
+    lines = getattr(_check_output, "lines", None)
+    if lines is not None:
+        lines.append(line)
+    else:
+        sys.stdout.write(line + "\n")
+
+def _say_lines(lines: list):
+    """Print several lines with a single write so they never interleave with other output"""
+    if lines:
+        sys.stdout.write("".join(line + "\n" for line in lines))
+
+def _run_check(check_func):
+    """Run one check with its diagnostics buffered; (result, error, diagnostic lines)"""
+    _check_output.lines = lines = []
+    try:
+        return check_func(), None, lines
+    except Exception as e:
+        return False, e, lines
+    finally:
+        _check_output.lines = None
+
 class MultiTenantValidator:
     def __init__(self):
         self.api_url = "http://localhost:8000"
         self.results = []
-        
-    def run_checks(self):
-        """Run all validation checks"""
-        print("🔍 Multi-Tenant Dynatrace Backup Manager - Validation Script\n")
-        print("=" * 60)
-        
-        checks = [
-            ("Backend API", self.check_api_running),
-            ("Database Schema", self.check_db_schema),
-            ("Environments Endpoint", self.check_environments_endpoint),
-            ("Bulk Operations Endpoint", self.check_bulk_operations_endpoint),
-            ("UI Components", self.check_ui_components),
-            ("Configuration", self.check_configuration),
+        self.skipped = set()
+        # Resolved once so later chdir calls don't change what is checked
+        self._ui_dir = Path("./desktop_ui/windows").resolve()
+        self._env_file = Path("./.env").resolve()
+        # One pooled client for all HTTP probes instead of a curl process each
+        self._http = requests.Session()
+        # (mtime_ns, keys found) of the last .env scan
+        self._env_scan = None
+        # Latest JSON report served by --serve; None until the first run finishes
+        self._report_body = None
+    
+    def _checks(self) -> list:
+        """(name, check, names of checks that must pass before it can run)"""
+        return [
+            ("Backend API", self.check_api_running, ()),
+            ("Database Schema", self.check_db_schema, ()),
+            ("Environments Endpoint", self.check_environments_endpoint, ("Backend API",)),
+            ("Bulk Operations Endpoint", self.check_bulk_operations_endpoint, ("Backend API",)),
+            ("UI Components", self.check_ui_components, ()),
+            ("Configuration", self.check_configuration, ()),
         ]
+    
+    def run_checks(self, as_json: bool = False):
+        """Run all validation checks"""
+        if not as_json:
+            print("🔍 Multi-Tenant Dynatrace Backup Manager - Validation Script\n")
+            print("=" * 60)
         
-        for name, check_func in checks:
-            try:
-                result = check_func()
-                status = "✅ PASS" if result else "❌ FAIL"
-                print(f"{status}: {name}")
-                self.results.append((name, result))
-            except Exception as e:
-                print(f"❌ FAIL: {name} - {str(e)}")
-                self.results.append((name, False))
+        checks = self._checks()
         
-        print("=" * 60)
-        self._print_summary()
+        try:
+            # In JSON mode check diagnostics go to stderr so stdout stays parseable
+            with redirect_stdout(sys.stderr) if as_json else nullcontext():
+                self._run_all(checks, quiet=as_json)
+        finally:
+            self._http.close()
+        
+        if as_json:
+            self._print_json()
+        else:
+            print("=" * 60)
+            self._print_summary()
         
         return all(r[1] for r in self.results)
     
+    def _run_all(self, checks, quiet: bool = False, silent: bool = False):
+        """Run the checks concurrently, reporting each one as soon as it finishes
+        
+        A check starts as soon as its prerequisites have passed and is skipped
+        if any of them failed, so a dead API doesn't cost two more timeouts.
+        Results are recorded in check order regardless of completion order.
+        ``quiet`` drops the per-check result lines and ``silent`` the
+        diagnostics as well.
+        """
+        outcomes = {}
+        skipped = set()
+        waiting = [check for check in checks if check[2]]
+        with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+            futures = {ex.submit(_run_check, check_func): name for name, check_func, deps in checks if not deps}
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    result, error, lines = future.result()
+                    outcomes[name] = (result, error)
+                    if not quiet:
+                        self._print_result(name, result, error, lines)
+                    elif not silent:
+                        _say_lines(lines)
+                
+                for check in [c for c in waiting if all(dep in outcomes for dep in c[2])]:
+                    waiting.remove(check)
+                    name, check_func, deps = check
+                    if all(outcomes[dep][0] for dep in deps):
+                        futures[ex.submit(_run_check, check_func)] = name
+                    else:
+                        outcomes[name] = (False, None)
+                        skipped.add(name)
+                        if not quiet:
+                            _say(f"⏭ SKIP: {name} - requires {', '.join(deps)}")
+        
+        self.results = [(name, outcomes[name][0]) for name, _, _ in checks]
+        self.skipped = skipped
+    
+    def _print_result(self, name: str, result: bool, error: Exception | None, lines: list):
+        """Print one finished check's diagnostics followed by its outcome"""
+        if error is not None:
+            status = f"❌ FAIL: {name} - {str(error)}"
+        else:
+            status = f"{'✅ PASS' if result else '❌ FAIL'}: {name}"
+        _say_lines([*lines, status])
+    
     def check_api_running(self) -> bool:
         """Check if FastAPI backend is running"""
+        # Any response proves the server is up, so skip transferring a body
         try:
-            result = subprocess.run(
-                ["curl", "-s", f"{self.api_url}/api/health/status"],
-                capture_output=True,
-                timeout=5
-            )
-            return result.returncode == 0
-        except:
+            self._http.head(f"{self.api_url}/api/health/status", timeout=5)
+            return True
+        except requests.RequestException:
             return False
     
     def check_db_schema(self) -> bool:
         """Verify database has multi-tenant tables"""
+        settings, error = _load_backend_settings()
+        if settings is None:
+            _say(f"  Backend settings could not be loaded: {error}")
+            return False
+        
+        db_url = settings.DATABASE_URL
+        if not db_url.startswith("sqlite:///"):
+            _say("  Unsupported database url")
+            return False
+        
+        db_path = Path(db_url.replace("sqlite:///", ""))
+        if not db_path.is_absolute():
+            db_path = (_BACKEND_DIR / db_path).resolve()
+        
+        if not db_path.exists():
+            _say("  Database not found")
+            return False
+        
+        conn = sqlite3.connect(db_path)
         try:
-            result = subprocess.run(
-                ["python", "-c", """
-import sqlite3
-from pathlib import Path
-from core.config import settings
-
-db_url = settings.DATABASE_URL
-if not db_url.startswith("sqlite:///"):
-    print("Unsupported database url")
-    exit(1)
-
-db_path = Path(db_url.replace("sqlite:///", ""))
-if not db_path.is_absolute():
-    db_path = (Path.cwd() / db_path).resolve()
-
-if not db_path.exists():
-    print('Database not found')
-    exit(1)
-
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-
-# Check for multi-tenant tables
-tables = [
-    'dynatrace_environments',
-    'environment_groups',
-    'bulk_operations',
-    'backups',
-    'restore_history'
-]
-
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-existing_tables = [row[0] for row in cursor.fetchall()]
-
-for table in tables:
-    if table not in existing_tables:
-        print(f'Missing table: {table}')
-        exit(1)
-
-# Check backup table has environment_id
-cursor.execute("PRAGMA table_info(backups)")
-columns = [row[1] for row in cursor.fetchall()]
-if 'environment_id' not in columns:
-    print('Missing environment_id column in backups table')
-    exit(1)
-
-print('Schema valid')
-exit(0)
-                """],
-                capture_output=True,
-                cwd="./backend/app"
-            )
-            return result.returncode == 0 and "Schema valid" in result.stdout.decode()
-        except:
+            cursor = conn.cursor()
+            version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+            key = {"db": str(db_path), "version": version}
+            if self._cached_schema() == key:
+                return True
+            if not self._schema_valid(cursor):
+                return False
+        finally:
+            conn.close()
+        
+        self._cache_schema(key)
+        return True
+    
+    def _schema_valid(self, cursor) -> bool:
+        """Look for the multi-tenant tables and columns"""
+        # Check for multi-tenant tables
+        tables = [
+            "dynatrace_environments",
+            "environment_groups",
+            "bulk_operations",
+            "backups",
+            "restore_history"
+        ]
+        
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name IN "
+            f"({','.join('?' * len(tables))})",
+            tables
+        )
+        existing_tables = {row[0] for row in cursor.fetchall()}
+        
+        if len(existing_tables) < len(tables):
+            for table in tables:
+                if table not in existing_tables:
+                    _say(f"  Missing table: {table}")
+            return False
+        
+        # Check backup table has environment_id
+        cursor.execute("PRAGMA table_info(backups)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if "environment_id" not in columns:
+            _say("  Missing environment_id column in backups table")
             return False
+        
+        return True
+    
+    def _cached_schema(self):
+        """Database and schema version of the last passing schema check, if any"""
+        try:
+            return json.loads(_SCHEMA_CACHE.read_text())
+        except (OSError, ValueError):
+            return None
+    
+    def _cache_schema(self, key: dict):
+        """Remember a passing schema check; written atomically so readers never see half a file"""
+        try:
+            _SCHEMA_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = _SCHEMA_CACHE.with_suffix(".tmp")
+            tmp.write_text(json.dumps(key))
+            tmp.replace(_SCHEMA_CACHE)
+        except OSError:
+            pass
     
     def check_environments_endpoint(self) -> bool:
         """Check /api/environments endpoint exists and works"""
         try:
-            result = subprocess.run(
-                ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}",
-                 f"{self.api_url}/api/environments"],
-                capture_output=True,
-                timeout=5
-            )
-            status_code = result.stdout.decode().strip()
+            status_code = self._http.get(
+                f"{self.api_url}/api/environments", timeout=5, allow_redirects=False
+            ).status_code
             # 200 OK, redirect, or 404 also means endpoint exists
-            return status_code in ["200", "301", "302", "307", "308", "404", "401"]
-        except:
+            return status_code in _ENV_OK_CODES
+        except requests.RequestException:
             return False
     
     def check_bulk_operations_endpoint(self) -> bool:
         """Check /api/bulk-operations endpoint exists"""
         try:
-            result = subprocess.run(
-                ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}",
-                 f"{self.api_url}/api/bulk-operations"],
-                capture_output=True,
-                timeout=5
-            )
-            status_code = result.stdout.decode().strip()
-            return status_code in ["200", "404", "401"]
-        except:
+            status_code = self._http.get(
+                f"{self.api_url}/api/bulk-operations", timeout=5, allow_redirects=False
+            ).status_code
+            return status_code in _BULK_OK_CODES
+        except requests.RequestException:
             return False
     
     def check_ui_components(self) -> bool:
         """Check UI files exist for multi-tenant"""
-        ui_files = [
-            Path("./desktop_ui/windows/environments.py"),
-            Path("./desktop_ui/windows/bulk_operations.py"),
-        ]
+        ui_dir = self._ui_dir
+        ui_files = ["environments.py", "bulk_operations.py"]
         
-        for file in ui_files:
-            if not file.exists():
-                print(f"  Missing: {file}")
+        # One directory listing instead of a stat per file
+        try:
+            entries = {entry.name for entry in os.scandir(ui_dir)}
+        except FileNotFoundError:
+            _say(f"  Missing: {ui_dir}")
+            return False
+        
+        for name in ui_files:
+            if name not in entries:
+                _say(f"  Missing: {ui_dir / name}")
                 return False
         
         return True
     
     def check_configuration(self) -> bool:
         """Check .env is properly configured"""
-        env_file = Path("./.env")
+        env_file = self._env_file
         if not env_file.exists():
-            print("  .env file not found")
+            _say("  .env file not found")
             return False
         
-        required_keys = [
-            "DYNATRACE_ENVIRONMENT_URL",
-            "DYNATRACE_API_TOKEN"
-        ]
+        mtime = env_file.stat().st_mtime_ns
+        if self._env_scan is None or self._env_scan[0] != mtime:
+            found = {m.group(1) for m in _ENV_KEYS_RE.finditer(env_file.read_text())}
+            self._env_scan = (mtime, found)
+        found = self._env_scan[1]
         
-        content = env_file.read_text()
-        for key in required_keys:
-            if key not in content:
-                print(f"  Missing key in .env: {key}")
+        for key in REQUIRED_ENV_KEYS:
+            if key not in found:
+                _say(f"  Missing key in .env: {key}")
                 return False
         
         return True
     
+    def serve(self, port: int, interval: float):
+        """Re-run the checks every ``interval`` seconds and serve the latest report over HTTP"""
+        threading.Thread(target=self._refresh_loop, args=(interval,), daemon=True).start()
+        
+        validator = self
+        
+        class ReportHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = validator._report_body
+                self.send_response(200 if body is not None else 503)
+                body = body or b'{"status": "pending"}'
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer(("127.0.0.1", port), ReportHandler)
+        print(f"Serving validation results on http://127.0.0.1:{port}/ (every {interval:g}s)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self._http.close()
+    
+    def _refresh_loop(self, interval: float):
+        """Run the checks forever, keeping the latest report ready to serve"""
+        while True:
+            started = time.monotonic()
+            try:
+                self._run_all(self._checks(), quiet=True, silent=True)
+                self._report_body = json.dumps(self._report()).encode()
+            except Exception:
+                # Keep serving the last report and try again next interval
+                traceback.print_exc()
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    
+    def _report(self) -> dict:
+        """All results as one JSON-ready document"""
+        passed = sum(1 for _, result in self.results if result)
+        return {
+            "checks": [
+                {"name": name, "ok": result, "skipped": name in self.skipped}
+                for name, result in self.results
+            ],
+            "passed": passed,
+            "total": len(self.results),
+        }
+    
+    def _print_json(self):
+        """Print all results as one JSON document"""
+        print(json.dumps(self._report()))
+    
     def _print_summary(self):
         """Print validation summary"""
         passed = sum(1 for _, result in self.results if result)
@@ -197,8 +405,20 @@ exit(0)
             print("- Start frontend: start.bat")
 
 def main():
+    parser = argparse.ArgumentParser(description="Validate the multi-tenant setup")
+    parser.add_argument("--json", action="store_true",
+                        help="Print one JSON report instead of per-check lines")
+    parser.add_argument("--serve", action="store_true",
+                        help="Keep running and serve the latest report as JSON over HTTP")
+    parser.add_argument("--port", type=int, default=8765, help="Port for --serve")
+    parser.add_argument("--interval", type=float, default=30, help="Seconds between runs for --serve")
+    args = parser.parse_args()
+    
     validator = MultiTenantValidator()
-    success = validator.run_checks()
+    if args.serve:
+        validator.serve(args.port, args.interval)
+        return
+    success = validator.run_checks(as_json=args.json)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":